@@ -0,0 +1,11 @@
+"""
+Pytest configuration for SecureAudit Pro.
+
+Puts the project root on sys.path once per session so test modules can
+import from ``src`` without per-file path setup.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
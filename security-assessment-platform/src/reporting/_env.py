@@ -0,0 +1,49 @@
+"""
+Shared Jinja2 Environment for all report generators.
+
+The executive, technical, and remediation generators render templates
+from the same directory. Building one Environment per template directory
+lets them share parsed templates, and the filesystem bytecode cache keeps
+compiled templates across processes so later runs skip template parsing.
+"""
+
+import os
+from typing import Dict, Optional
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+# One Environment per resolved template directory
+_ENVS: Dict[str, Environment] = {}
+
+
+def get_env(template_dir: Optional[str] = None) -> Environment:
+    """
+    Return the shared Jinja2 Environment for a template directory.
+
+    The Environment is constructed on first use and reused by every
+    generator that renders from the same directory.
+
+    Args:
+        template_dir: Optional custom template directory path.
+
+    Returns:
+        Configured Jinja2 Environment.
+    """
+    key = os.path.abspath(template_dir or TEMPLATE_DIR)
+    env = _ENVS.get(key)
+    if env is None:
+        env = Environment(
+            loader=FileSystemLoader(key),
+            autoescape=select_autoescape(["html"]),
+            cache_size=1000,
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache(),
+        )
+        _ENVS[key] = env
+    return env
@@ -13,11 +13,10 @@ import os
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-logger = logging.getLogger(__name__)
+from src.reporting._env import TEMPLATE_DIR, get_env
 
-TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+logger = logging.getLogger(__name__)
 
 # CVSS v3.1 severity classification
 CVSS_SEVERITY = {
@@ -67,10 +66,7 @@ class TechnicalReportGenerator:
             template_dir: Optional custom template directory path.
         """
         self.template_dir = template_dir or TEMPLATE_DIR
-        self.env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(["html"]),
-        )
+        self.env = get_env(self.template_dir)
 
     def generate(
         self,
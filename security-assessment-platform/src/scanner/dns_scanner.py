@@ -14,6 +14,7 @@ ETHICAL USE NOTICE:
     for the target domain.
 """
 
+import re
 import socket
 import logging
 from typing import Dict, List, Optional, Any
@@ -30,6 +31,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Terminal SPF "all" mechanism and the policy each qualifier maps to
+_SPF_ALL_RE = re.compile(r"([-+?~])all")
+_SPF_QUALIFIER_POLICY = {
+    "+": "pass",
+    "-": "fail",
+    "~": "softfail",
+    "?": "neutral",
+}
+
 
 @dataclass
 class DNSRecord:
@@ -372,10 +382,10 @@ class DNSScanner:
             spf_result.mechanisms.append(part)
 
         # Check policy (last mechanism)
-        if parts:
-            last = parts[-1].lower()
-            if last == "+all":
-                spf_result.policy = "pass"
+        match = _SPF_ALL_RE.fullmatch(parts[-1].lower()) if parts else None
+        if match:
+            spf_result.policy = _SPF_QUALIFIER_POLICY[match.group(1)]
+            if spf_result.policy == "pass":
                 spf_result.issues.append(
                     "SPF policy is +all (allows anyone to send)"
                 )
@@ -394,12 +404,7 @@ class DNSScanner:
                         "Enumerate all legitimate sending sources first."
                     ),
                 })
-            elif last == "~all":
-                spf_result.policy = "softfail"
-            elif last == "-all":
-                spf_result.policy = "fail"
-            elif last == "?all":
-                spf_result.policy = "neutral"
+            elif spf_result.policy == "neutral":
                 spf_result.issues.append(
                     "SPF policy is ?all (neutral - no protection)"
                 )
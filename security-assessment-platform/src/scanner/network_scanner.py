@@ -14,7 +14,8 @@ ETHICAL USE NOTICE:
 import socket
 import time
 import logging
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -23,7 +24,7 @@ logger = logging.getLogger(__name__)
 
 
 # Well-known service-to-port mappings for identification
-COMMON_SERVICES: Dict[int, str] = {
+COMMON_SERVICES: Mapping[int, str] = MappingProxyType({
     21: "FTP",
     22: "SSH",
     23: "Telnet",
@@ -51,18 +52,18 @@ COMMON_SERVICES: Dict[int, str] = {
     8888: "HTTP-Alt",
     9200: "Elasticsearch",
     27017: "MongoDB",
-}
+})
 
 # Ports considered high-risk when exposed
-HIGH_RISK_PORTS: set = {
+HIGH_RISK_PORTS: FrozenSet[int] = frozenset({
     21, 23, 135, 139, 445, 1433, 1521, 3306, 3389,
     5432, 5900, 6379, 9200, 27017,
-}
+})
 
 # Ports considered medium-risk when exposed
-MEDIUM_RISK_PORTS: set = {
+MEDIUM_RISK_PORTS: FrozenSet[int] = frozenset({
     25, 53, 80, 110, 111, 143, 8080, 8888,
-}
+})
 
 
 @dataclass
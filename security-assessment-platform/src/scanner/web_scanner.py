@@ -12,6 +12,7 @@ ETHICAL USE NOTICE:
     Unauthorized scanning may violate computer misuse laws.
 """
 
+import re
 import ssl
 import socket
 import logging
@@ -28,6 +29,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Scheme followed by a non-empty network location
+_URL_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*://[^/?#\s]")
+
 
 # Security headers that should be present on production web applications
 REQUIRED_SECURITY_HEADERS = {
@@ -309,10 +313,11 @@ class WebScanner:
         if not url:
             raise ValueError("URL must be specified")
 
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
+        if not _URL_RE.match(url):
             raise ValueError(f"Invalid URL format: {url}")
 
+        parsed = urlparse(url)
+
         result = WebScanResult(url=url)
         result.scan_timestamp = datetime.now().isoformat()
 
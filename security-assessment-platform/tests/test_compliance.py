@@ -10,10 +10,6 @@ Tests cover:
 """
 
 import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 class TestISO27001Checker(unittest.TestCase):
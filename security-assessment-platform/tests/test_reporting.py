@@ -13,9 +13,6 @@ Tests cover:
 import unittest
 import os
 import tempfile
-import sys
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 class TestExecutiveReport(unittest.TestCase):
@@ -288,5 +285,28 @@ class TestRemediationRoadmap(unittest.TestCase):
             self.assertTrue(os.path.exists(path))
 
 
+class TestSharedEnvironment(unittest.TestCase):
+    """Test cases for the shared Jinja2 Environment."""
+
+    def test_generators_share_environment(self):
+        """Test all generators reuse one Environment per template dir."""
+        from src.reporting.executive_report import ExecutiveReportGenerator
+        from src.reporting.technical_report import TechnicalReportGenerator
+        from src.reporting.remediation_roadmap import RemediationRoadmapGenerator
+        executive = ExecutiveReportGenerator()
+        technical = TechnicalReportGenerator()
+        roadmap = RemediationRoadmapGenerator()
+        self.assertIs(executive.env, technical.env)
+        self.assertIs(technical.env, roadmap.env)
+        self.assertIsNotNone(executive.env.bytecode_cache)
+
+    def test_custom_template_dir_gets_own_environment(self):
+        """Test a custom template directory is not served the default env."""
+        from src.reporting._env import get_env
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertIsNot(get_env(tmpdir), get_env())
+            self.assertIs(get_env(tmpdir), get_env(tmpdir))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,8 @@
+"""
+Python version compatibility shims shared by the scanner modules.
+"""
+
+import sys
+
+# Slotted dataclasses drop the per-instance __dict__; slots=True needs 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -12,29 +12,21 @@ Usage:
 ETHICAL USE ONLY: Only scan targets you own or have written authorization to test.
 """
 
-import os
+import io
+import socket
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlparse
 
 import click
-import requests
-import urllib3
-
-# Suppress insecure request warnings for self-signed certs
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from scanner.header_check import check_headers
-from scanner.sqli_scanner import scan_sqli
-from scanner.xss_scanner import scan_xss
-from scanner.port_scanner import scan_ports
-from scanner.directory_scanner import scan_directories
-from scanner.reporter import (
-    build_report, render_html_report, render_json_report, print_summary
-)
+
+# The HTTP stack and scanner backends are imported inside the commands that
+# use them, so 'modules', '--help' and '--version' start without loading them.
 
 
 BANNER = r"""
@@ -58,19 +50,130 @@ DISCLAIMER = """
 +==========================================================================+
 """
 
-AVAILABLE_MODULES = {
+# Default location for reports when --output is not given
+_REPORTS_DIR = Path(__file__).resolve().parent.parent / 'reports'
+_REPORTS_READY = False
+
+SEP = "=" * 70
+HEADER_FMT = f"{SEP}\n  {{}}\n{SEP}"
+
+AVAILABLE_MODULES = MappingProxyType({
     'headers': 'HTTP Security Header Analysis',
     'sqli': 'SQL Injection Scanner',
     'xss': 'Cross-Site Scripting Scanner',
     'ports': 'TCP Port Scanner',
     'dirs': 'Directory Enumeration Scanner',
-}
+})
+_MODULE_KEYS = frozenset(AVAILABLE_MODULES)
+
+
+def _ensure_reports_dir():
+    """Create the default reports directory once per process."""
+    global _REPORTS_READY
+    if not _REPORTS_READY:
+        _REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        _REPORTS_READY = True
+
+
+def _load_requests():
+    """Import requests on first use and silence self-signed cert warnings."""
+    import requests
+    import urllib3
+
+    # Suppress insecure request warnings for self-signed certs
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return requests
+
+
+class _ThreadBufferedStdout:
+    """Stand-in for sys.stdout that buffers output per capturing thread.
+
+    Threads running a scan module through capture() write into their own
+    buffer; every other thread writes straight through to the real stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, fn):
+        """Run fn, returning (result, text it printed)."""
+        self._local.buffer = io.StringIO()
+        try:
+            result = fn()
+            return result, self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            return self._stream.write(text)
+        return buffer.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _tcp_probe(target_url: str, timeout: float = 2.0) -> bool:
+    """Return True if a TCP connection to the target's host and port succeeds."""
+    parsed = urlparse(target_url)
+    if not parsed.hostname:
+        return False
+    try:
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        socket.create_connection((parsed.hostname, port), timeout=timeout).close()
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+_LOCAL_HOSTS = frozenset({'127.0.0.1', 'localhost', '::1'})
+
+
+def _fast_local_probe(target_url: str, retries: int = 10,
+                      interval: float = 0.1):
+    """Probe a loopback target with short TCP connect retries.
+
+    Gives a local app that is still starting up about a second to accept
+    connections instead of waiting on the HTTP timeout.
+
+    Returns:
+        True if the port accepted a connection, False if every attempt
+        failed, or None if the target is not a loopback host.
+    """
+    parsed = urlparse(target_url)
+    if parsed.hostname not in _LOCAL_HOSTS:
+        return None
+    try:
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+    except ValueError:
+        return False
+    for _ in range(retries):
+        try:
+            socket.create_connection((parsed.hostname, port), timeout=0.2).close()
+            return True
+        except OSError:
+            time.sleep(interval)
+    return False
 
 
 def validate_target(target_url: str) -> bool:
-    """Validate that the target is reachable."""
+    """Validate that the target is reachable.
+
+    A raw TCP connect fails fast on typos and closed or firewalled ports.
+    Once it succeeds, any HTTP response proves reachability, so a HEAD
+    request is enough and avoids downloading the response body.
+    """
+    if not _tcp_probe(target_url):
+        return False
+
+    requests = _load_requests()
     try:
-        response = requests.get(target_url, timeout=10, verify=False)
+        requests.head(target_url, timeout=10, verify=False, allow_redirects=False)
         return True
     except requests.exceptions.ConnectionError:
         return False
@@ -155,8 +258,16 @@ def scan(target, output, output_format, modules, timeout, verbose,
         # Save report to specific path
         python -m scanner.cli scan -o reports/my_report.html
     """
-    click.echo(BANNER)
-    click.echo(DISCLAIMER)
+    from scanner.header_check import check_headers
+    from scanner.sqli_scanner import scan_sqli
+    from scanner.xss_scanner import scan_xss
+    from scanner.port_scanner import scan_ports
+    from scanner.directory_scanner import create_session, scan_directories
+    from scanner.reporter import (
+        build_report, render_html_report, render_json_report, print_summary
+    )
+
+    click.echo(f"{BANNER}\n{DISCLAIMER}")
 
     # Confirm ethical use
     if not accept_disclaimer:
@@ -170,108 +281,134 @@ def scan(target, output, output_format, modules, timeout, verbose,
 
     # Parse modules
     if modules.lower() == 'all':
-        selected_modules = list(AVAILABLE_MODULES.keys())
+        selected_modules = list(AVAILABLE_MODULES)
     else:
         selected_modules = [m.strip().lower() for m in modules.split(',')]
-        invalid = [m for m in selected_modules if m not in AVAILABLE_MODULES]
+        invalid = [m for m in selected_modules if m not in _MODULE_KEYS]
         if invalid:
             click.echo(f"  [!] Invalid modules: {', '.join(invalid)}")
-            click.echo(f"  [*] Available: {', '.join(AVAILABLE_MODULES.keys())}")
+            click.echo(f"  [*] Available: {', '.join(AVAILABLE_MODULES)}")
             sys.exit(1)
 
     # Display scan configuration
-    click.echo("  SCAN CONFIGURATION:")
-    click.echo(f"  Target:     {target}")
-    click.echo(f"  Modules:    {', '.join(selected_modules)}")
-    click.echo(f"  Timeout:    {timeout}s")
-    click.echo(f"  Verbose:    {verbose}")
-    click.echo(f"  Format:     {output_format}")
-    click.echo()
+    click.echo(
+        f"  SCAN CONFIGURATION:\n"
+        f"  Target:     {target}\n"
+        f"  Modules:    {', '.join(selected_modules)}\n"
+        f"  Timeout:    {timeout}s\n"
+        f"  Verbose:    {verbose}\n"
+        f"  Format:     {output_format}\n"
+    )
 
     # Validate target connectivity
     click.echo(f"  [*] Validating target connectivity...")
-    if not validate_target(target):
-        click.echo(f"  [!] Cannot connect to {target}")
-        click.echo(f"  [!] Ensure the target is running and accessible.")
-        click.echo(f"  [!] For the vulnerable app: cd vulnerable_app && python app.py")
+    reachable = _fast_local_probe(target)
+    if reachable is None:
+        reachable = validate_target(target)
+    if not reachable:
+        click.echo(
+            f"  [!] Cannot connect to {target}\n"
+            "  [!] Ensure the target is running and accessible.\n"
+            "  [!] For the vulnerable app: cd vulnerable_app && python app.py"
+        )
         sys.exit(1)
-    click.echo(f"  [+] Target is reachable.")
-    click.echo()
+    click.echo("  [+] Target is reachable.\n")
+
+    # One keep-alive session shared by the HTTP modules so they reuse
+    # pooled connections instead of reconnecting for every request. The
+    # pool fits the 20 directory workers plus the other HTTP modules.
+    _load_requests()
+    session = create_session(pool_size=24)
 
-    # Initialize results storage
     scan_start = datetime.now()
-    header_results = None
-    sqli_results = None
-    xss_results = None
-    port_results = None
-    directory_results = None
-    total_requests = 0
 
     # -----------------------------------------------------------------------
     # Execute selected scan modules
     # -----------------------------------------------------------------------
 
-    # Module 1: Security Headers
-    if 'headers' in selected_modules:
-        click.echo("=" * 70)
-        click.echo("  MODULE: HTTP Security Header Analysis")
-        click.echo("=" * 70)
-        header_results = check_headers(target, timeout=timeout, verbose=verbose)
-        total_requests += 1
-        click.echo()
-
-    # Module 2: SQL Injection
-    if 'sqli' in selected_modules:
-        click.echo("=" * 70)
-        click.echo("  MODULE: SQL Injection Scanner")
-        click.echo("=" * 70)
-        sqli_results = scan_sqli(target, timeout=timeout, verbose=verbose)
-        total_requests += sqli_results.payloads_sent
-        click.echo()
-
-    # Module 3: Cross-Site Scripting
-    if 'xss' in selected_modules:
-        click.echo("=" * 70)
-        click.echo("  MODULE: Cross-Site Scripting Scanner")
-        click.echo("=" * 70)
-        xss_results = scan_xss(target, timeout=timeout, verbose=verbose)
-        total_requests += xss_results.payloads_sent
-        click.echo()
-
-    # Module 4: Port Scanner
-    if 'ports' in selected_modules:
-        click.echo("=" * 70)
-        click.echo("  MODULE: TCP Port Scanner")
-        click.echo("=" * 70)
-        port_results = scan_ports(
+    # The modules are independent and spend their time waiting on the
+    # target, so they run concurrently. Each module's output is buffered
+    # and printed below in the usual module order. The SQL injection
+    # scanner's time-based payloads judge injection by response delay, so
+    # it runs on its own afterwards rather than against a target loaded by
+    # the other modules.
+    tasks = {
+        'headers': lambda: check_headers(
+            target, timeout=timeout, verbose=verbose, session=session
+        ),
+        'sqli': lambda: scan_sqli(
+            target, timeout=timeout, verbose=verbose, session=session
+        ),
+        'xss': lambda: scan_xss(
+            target, timeout=timeout, verbose=verbose, session=session
+        ),
+        'ports': lambda: scan_ports(
             target,
             scan_type=port_scan_type,
             timeout=min(timeout, 3),
             verbose=verbose
+        ),
+        'dirs': lambda: scan_directories(
+            target, timeout=timeout, verbose=verbose, session=session,
+            detect_wildcard=True
+        ),
+    }
+    tasks = {name: fn for name, fn in tasks.items() if name in selected_modules}
+
+    concurrent = {name: fn for name, fn in tasks.items() if name != 'sqli'}
+
+    stdout = sys.stdout
+    sys.stdout = _ThreadBufferedStdout(stdout)
+    try:
+        outputs = {}
+        if concurrent:
+            with ThreadPoolExecutor(max_workers=len(concurrent)) as executor:
+                futures = {
+                    name: executor.submit(sys.stdout.capture, fn)
+                    for name, fn in concurrent.items()
+                }
+            outputs = {name: future.result() for name, future in futures.items()}
+        if 'sqli' in tasks:
+            outputs['sqli'] = sys.stdout.capture(tasks['sqli'])
+    finally:
+        sys.stdout = stdout
+
+    results = {}
+    for name in AVAILABLE_MODULES:
+        if name not in outputs:
+            continue
+        results[name], captured = outputs[name]
+        header = HEADER_FMT.format(f"MODULE: {AVAILABLE_MODULES[name]}")
+        click.echo(f"{header}\n{captured}")
+
+    header_results = results.get('headers')
+    sqli_results = results.get('sqli')
+    xss_results = results.get('xss')
+    port_results = results.get('ports')
+    directory_results = results.get('dirs')
+
+    # The header check sends a single request and keeps no counter, so a
+    # missing attribute counts as one request
+    total_requests = sum(
+        getattr(result, attr, 1)
+        for result, attr in (
+            (header_results, 'requests_sent'),
+            (sqli_results, 'payloads_sent'),
+            (xss_results, 'payloads_sent'),
+            (port_results, 'total_ports_scanned'),
+            (directory_results, 'paths_checked'),
         )
-        total_requests += port_results.total_ports_scanned
-        click.echo()
-
-    # Module 5: Directory Enumeration
-    if 'dirs' in selected_modules:
-        click.echo("=" * 70)
-        click.echo("  MODULE: Directory Enumeration Scanner")
-        click.echo("=" * 70)
-        directory_results = scan_directories(
-            target, timeout=timeout, verbose=verbose
-        )
-        total_requests += directory_results.paths_checked
-        click.echo()
+        if result is not None
+    )
 
     # -----------------------------------------------------------------------
     # Build and generate report
     # -----------------------------------------------------------------------
 
+    session.close()
     scan_end = datetime.now()
 
-    click.echo("=" * 70)
-    click.echo("  GENERATING REPORT")
-    click.echo("=" * 70)
+    click.echo(HEADER_FMT.format("GENERATING REPORT"))
 
     report = build_report(
         target_url=target,
@@ -289,35 +426,34 @@ def scan(target, output, output_format, modules, timeout, verbose,
     # Generate default output path if not specified
     if output is None:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        reports_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'reports'
-        )
-        os.makedirs(reports_dir, exist_ok=True)
+        _ensure_reports_dir()
 
         if output_format in ('html', 'both'):
-            output = os.path.join(reports_dir, f'scan_report_{timestamp}.html')
+            output = str(_REPORTS_DIR / f'scan_report_{timestamp}.html')
         else:
-            output = os.path.join(reports_dir, f'scan_report_{timestamp}.json')
-
-    # Render report(s)
-    if output_format in ('html', 'both'):
-        html_path = output if output.endswith('.html') else output + '.html'
-        render_html_report(report, html_path)
-
-    if output_format in ('json', 'both'):
-        json_path = output.replace('.html', '.json') if output.endswith('.html') else output
-        if not json_path.endswith('.json'):
-            json_path += '.json'
-        render_json_report(report, json_path)
+            output = str(_REPORTS_DIR / f'scan_report_{timestamp}.json')
+
+    # Render report(s). A .html or .json suffix on --output is swapped per
+    # format; any other name gets the format's suffix appended.
+    out = Path(output)
+    if out.suffix in ('.html', '.json'):
+        out = out.with_suffix('')
+    renderers = {
+        'html': (render_html_report, out.with_name(out.name + '.html')),
+        'json': (render_json_report, out.with_name(out.name + '.json')),
+    }
+    formats = ('html', 'json') if output_format == 'both' else (output_format,)
+    for fmt in formats:
+        render, path = renderers[fmt]
+        render(report, str(path))
 
     # Print summary
     print_summary(report)
 
-    click.echo()
-    click.echo("  Scan complete. Review the report for detailed findings.")
-    click.echo("  Remember: Only use findings for authorized remediation.")
-    click.echo()
+    click.echo(
+        "\n  Scan complete. Review the report for detailed findings.\n"
+        "  Remember: Only use findings for authorized remediation.\n"
+    )
 
 
 @cli.command()
@@ -326,9 +462,7 @@ def modules():
     click.echo("\n  Available Scan Modules:\n")
     for name, description in AVAILABLE_MODULES.items():
         click.echo(f"    {name:<12s} - {description}")
-    click.echo()
-    click.echo("  Usage: python -m scanner.cli scan --modules headers,sqli,xss")
-    click.echo()
+    click.echo("\n  Usage: python -m scanner.cli scan --modules headers,sqli,xss\n")
 
 
 @cli.command()
@@ -340,16 +474,29 @@ def check(target):
 
     if validate_target(target):
         click.echo(f"  [+] Target is reachable!")
+        requests = _load_requests()
         try:
-            response = requests.get(target, timeout=10, verify=False)
-            click.echo(f"  [+] Status Code: {response.status_code}")
-            click.echo(f"  [+] Server: {response.headers.get('Server', 'N/A')}")
-            click.echo(f"  [+] Content-Length: {len(response.content)} bytes")
+            # Stream the response so the body is only read when the
+            # server does not advertise its length
+            with requests.get(target, timeout=10, verify=False,
+                              stream=True) as response:
+                content_length = response.headers.get('Content-Length')
+                if content_length:
+                    size = int(content_length)
+                else:
+                    size = sum(len(chunk) for chunk in response.iter_content(4096))
+                click.echo(
+                    f"  [+] Status Code: {response.status_code}\n"
+                    f"  [+] Server: {response.headers.get('Server', 'N/A')}\n"
+                    f"  [+] Content-Length: {size} bytes"
+                )
         except Exception:
             pass
     else:
-        click.echo(f"  [!] Target is NOT reachable.")
-        click.echo(f"  [!] Ensure the application is running.")
+        click.echo(
+            "  [!] Target is NOT reachable.\n"
+            "  [!] Ensure the application is running."
+        )
     click.echo()
 
 
@@ -21,15 +21,20 @@ CWE Reference: CWE-538 (File and Directory Information Exposure)
 ETHICAL USE ONLY: Only scan systems you own or have written authorization to test.
 """
 
+import sys
 import time
+import uuid
 import requests
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
-from urllib.parse import urljoin
+from typing import List, Dict, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from scanner._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class DirectoryFinding:
     """Represents an exposed directory or file finding."""
     url: str
@@ -42,9 +47,11 @@ class DirectoryFinding:
     recommendation: str
     owasp_category: str
     cwe_id: str
+    # Sort key derived from severity; lower is more severe
+    _severity_rank: int = field(default=5, repr=False)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DirectoryScanResult:
     """Complete result of a directory enumeration scan."""
     target_url: str
@@ -53,6 +60,48 @@ class DirectoryScanResult:
     paths_found: int = 0
     scan_duration: float = 0.0
     errors: List[str] = field(default_factory=list)
+    wildcard_status: Optional[int] = None
+    wildcard_length: Optional[int] = None
+
+
+# Severity sort order for findings (most severe first)
+SEVERITY_RANK = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3, 'Informational': 4}
+
+# Console markers for findings by severity
+SEVERITY_ICONS = {
+    'Critical': '[!!]',
+    'High': '[!]',
+    'Medium': '[*]',
+    'Low': '[.]',
+    'Informational': '[-]',
+}
+
+# Leading text of each FOUND line, built once per severity
+_FOUND_PREFIX = {
+    severity: f"  {icon} FOUND: " for severity, icon in SEVERITY_ICONS.items()
+}
+
+# Abort the scan after this many connection failures or timeouts in a row
+MAX_CONSECUTIVE_ERRORS = 20
+
+# Status lines are written to stdout in batches of this size
+OUTPUT_BATCH_SIZE = 16
+
+# Largest response body read just to measure its size
+MAX_BODY_READ = 64 * 1024
+
+# Status codes that mean a path exists
+# 200: OK, 301/302: Redirect (resource exists), 401/403: Protected
+FOUND_STATUS_CODES = frozenset({200, 301, 302, 401, 403})
+
+# Compressed bodies keep found pages small on the wire; requests decodes
+# them transparently when the body is read
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                  'AppleWebKit/537.36 (KHTML, like Gecko) '
+                  'Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate',
+}
 
 
 # -----------------------------------------------------------------------
@@ -364,71 +413,259 @@ SCAN_PATHS = {
 }
 
 
-def _check_path(
+@dataclass(frozen=True)
+class _CategoryTemplate:
+    """Finding fields shared by every path of one wordlist category."""
+    category: str
+    severity: str
+    severity_rank: int
+    protected_severity: str
+    protected_rank: int
+    description: str
+    protected_descriptions: Dict[int, str]
+    recommendation: str
+    owasp: str
+    cwe: str
+
+
+def _build_template(config: Dict) -> _CategoryTemplate:
+    """Precompute the finding fields for a category configuration."""
+    severity = config['severity']
+    # Protected but exists - lower severity
+    protected_severity = 'Low' if severity != 'Critical' else 'Medium'
+    return _CategoryTemplate(
+        category=config['category'],
+        severity=severity,
+        severity_rank=SEVERITY_RANK.get(severity, 5),
+        protected_severity=protected_severity,
+        protected_rank=SEVERITY_RANK.get(protected_severity, 5),
+        description=config['description'],
+        protected_descriptions={
+            status: (
+                f"Path exists but is protected (HTTP {status}). "
+                f"{config['description']}"
+            )
+            for status in (401, 403)
+        },
+        recommendation=config['recommendation'],
+        owasp=config['owasp'],
+        cwe=config['cwe'],
+    )
+
+
+CUSTOM_PATH_CONFIG = {
+    'category': 'Custom Path',
+    'severity': 'Medium',
+    'owasp': 'A01:2021 - Broken Access Control',
+    'cwe': 'CWE-538',
+    'description': 'Custom path is accessible.',
+    'recommendation': 'Review if this path should be publicly accessible.',
+}
+
+# Finding templates, built once at import
+_TEMPLATES = {name: _build_template(config) for name, config in SCAN_PATHS.items()}
+_CUSTOM_TEMPLATE = _build_template(CUSTOM_PATH_CONFIG)
+
+# Flattened wordlist of (path, template) pairs, with each category's
+# entries addressable as one slice
+_FLAT: List[Tuple[str, _CategoryTemplate]] = []
+_BY_CAT: Dict[str, slice] = {}
+for _name, _config in SCAN_PATHS.items():
+    _start = len(_FLAT)
+    _FLAT.extend((_path, _TEMPLATES[_name]) for _path in _config['paths'])
+    _BY_CAT[_name] = slice(_start, len(_FLAT))
+del _name, _config, _start
+
+
+def create_session(pool_size: int = 20) -> requests.Session:
+    """
+    Create a keep-alive session whose connection pool fits the scan.
+
+    requests keeps at most 10 idle connections per host by default, so a
+    20-thread scan against one host would keep discarding sockets and
+    reconnecting. Sizing the pool to the worker count lets every thread
+    reuse its own connection.
+
+    The session is shared by every HTTP module, so it refuses all cookies:
+    a Set-Cookie from one payload (say, a successful auth-bypass login)
+    must not ride along on later payloads and change what they detect.
+
+    Args:
+        pool_size: Maximum pooled connections per host
+
+    Returns:
+        requests.Session with certificate verification and cookies disabled
+    """
+    session = requests.Session()
+    session.verify = False
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _body_length(response: requests.Response) -> int:
+    """
+    Return the size of a streamed response body.
+
+    Bodies up to MAX_BODY_READ bytes are read so the pooled connection can
+    be reused. Larger bodies are sized from Content-Length and left unread,
+    so a found sitemap or dump is never downloaded just to be measured.
+    Without a usable Content-Length, reading stops once the body exceeds
+    MAX_BODY_READ and the bytes read so far are reported.
+    """
+    declared = response.headers.get('Content-Length')
+    try:
+        size = int(declared)
+    except (TypeError, ValueError):
+        size = None
+
+    if size is not None:
+        if size > MAX_BODY_READ:
+            return size
+        return len(response.content)
+
+    read = 0
+    for chunk in response.iter_content(8192):
+        read += len(chunk)
+        if read > MAX_BODY_READ:
+            break
+    return read
+
+
+def _matches_wildcard(
+    status_code: int,
+    content_length: int,
+    baseline: Tuple[int, int]
+) -> bool:
+    """Return True if a response looks like the target's catch-all reply."""
+    base_status, base_length = baseline
+    return (
+        status_code == base_status
+        and abs(content_length - base_length) < max(64, base_length * 0.05)
+    )
+
+
+def _calibrate_baseline(
     base_url: str,
+    timeout: int = 10,
+    session: Optional[requests.Session] = None
+) -> Optional[Tuple[int, int]]:
+    """
+    Probe a random path to detect wildcard (soft-404) responses.
+
+    Servers with catch-all routes answer every path with the same page,
+    which would otherwise turn the whole wordlist into findings.
+
+    Args:
+        base_url: Target base URL
+        timeout: Request timeout
+        session: Optional requests.Session to reuse pooled connections
+
+    Returns:
+        (status_code, content_length) of the catch-all response if the
+        random path looks found, None otherwise
+    """
+    url = f"{base_url.rstrip('/')}/{uuid.uuid4().hex}/{uuid.uuid4().hex}"
+    try:
+        response = (session or requests).get(
+            url,
+            timeout=timeout,
+            allow_redirects=False,
+            verify=False,
+            headers=REQUEST_HEADERS,
+            stream=True,
+        )
+        try:
+            content_length = _body_length(response)
+        finally:
+            response.close()
+    except requests.exceptions.RequestException:
+        return None
+
+    if response.status_code in FOUND_STATUS_CODES:
+        return response.status_code, content_length
+    return None
+
+
+def _check_path(
+    url: str,
     path: str,
-    category_config: Dict,
-    timeout: int = 10
+    template: _CategoryTemplate,
+    timeout: int = 10,
+    session: Optional[requests.Session] = None,
+    baseline: Optional[Tuple[int, int]] = None
 ) -> Optional[DirectoryFinding]:
     """
     Check if a single path is accessible.
 
     Args:
-        base_url: Target base URL
-        path: Path to check
-        category_config: Category configuration dict
+        url: Absolute URL of the path
+        path: Path to check, as reported in the finding
+        template: Precomputed finding fields for the path's category
         timeout: Request timeout
+        session: Optional requests.Session to reuse pooled connections
+        baseline: Optional (status_code, content_length) of the target's
+                  wildcard response; matching responses are ignored
 
     Returns:
         DirectoryFinding if accessible, None otherwise
-    """
-    url = urljoin(base_url.rstrip('/') + '/', path.lstrip('/'))
 
+    Raises:
+        requests.exceptions.ConnectionError: If the target cannot be reached
+        requests.exceptions.Timeout: If the request times out
+    """
     try:
-        response = requests.get(
+        response = (session or requests).get(
             url,
             timeout=timeout,
             allow_redirects=False,
             verify=False,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                              'AppleWebKit/537.36 (KHTML, like Gecko) '
-                              'Chrome/120.0.0.0 Safari/537.36'
-            }
+            headers=REQUEST_HEADERS,
+            stream=True,
         )
-
-        # Consider these status codes as "found"
-        # 200: OK, 301/302: Redirect (resource exists), 401/403: Protected
-        if response.status_code in [200, 301, 302, 401, 403]:
+        try:
+            content_length = _body_length(response)
+        finally:
+            response.close()
+
+        if baseline and _matches_wildcard(
+            response.status_code, content_length, baseline
+        ):
+            return None
+
+        status_code = response.status_code
+        if status_code in FOUND_STATUS_CODES:
             # Determine severity based on status code
-            severity = category_config['severity']
-            if response.status_code in [401, 403]:
-                # Protected but exists - lower severity
-                severity = 'Low' if severity != 'Critical' else 'Medium'
-                description = (
-                    f"Path exists but is protected (HTTP {response.status_code}). "
-                    f"{category_config['description']}"
-                )
+            if status_code in (401, 403):
+                severity = template.protected_severity
+                rank = template.protected_rank
+                description = template.protected_descriptions[status_code]
             else:
-                description = category_config['description']
+                severity = template.severity
+                rank = template.severity_rank
+                description = template.description
 
             return DirectoryFinding(
                 url=url,
                 path=path,
-                status_code=response.status_code,
-                content_length=len(response.content),
-                category=category_config['category'],
+                status_code=status_code,
+                content_length=content_length,
+                category=template.category,
                 severity=severity,
                 description=description,
-                recommendation=category_config['recommendation'],
-                owasp_category=category_config['owasp'],
-                cwe_id=category_config['cwe'],
+                recommendation=template.recommendation,
+                owasp_category=template.owasp,
+                cwe_id=template.cwe,
+                _severity_rank=rank,
             )
 
-    except requests.exceptions.ConnectionError:
-        pass
-    except requests.exceptions.Timeout:
-        pass
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+        # Let the scan loop count these toward its circuit breaker
+        raise
     except requests.exceptions.RequestException:
         pass
 
@@ -441,7 +678,9 @@ def scan_directories(
     custom_paths: Optional[List[str]] = None,
     timeout: int = 10,
     max_threads: int = 20,
-    verbose: bool = False
+    verbose: bool = False,
+    session: Optional[requests.Session] = None,
+    detect_wildcard: bool = False
 ) -> DirectoryScanResult:
     """
     Run a directory enumeration scan against the target.
@@ -456,6 +695,9 @@ def scan_directories(
         timeout: Request timeout in seconds
         max_threads: Maximum concurrent threads
         verbose: Enable verbose output
+        session: Optional requests.Session to reuse pooled connections
+        detect_wildcard: Probe a random path first and ignore responses
+                         that match the target's catch-all reply
 
     Returns:
         DirectoryScanResult with all findings
@@ -464,29 +706,34 @@ def scan_directories(
 
     result = DirectoryScanResult(target_url=target_url)
 
-    # Build list of paths to check
-    paths_to_check = []  # List of (path, category_config) tuples
+    # Build list of paths to check, keyed by normalized path. '/admin' and
+    # '/admin/' name the same resource on most servers, so each is probed
+    # once, under the most severe category that lists it. Case is kept:
+    # '/Backup' and '/backup' are distinct resources on most servers.
+    base = target_url.rstrip('/')
+    queued = {}  # Normalized path -> (url, path, _CategoryTemplate)
+
+    def add_path(path, template):
+        key = path.rstrip('/')
+        current = queued.get(key)
+        if current is None:
+            queued[key] = (base + '/' + path.lstrip('/'), path, template)
+        elif template.severity_rank < current[2].severity_rank:
+            queued[key] = (current[0], current[1], template)
 
-    selected_categories = categories or list(SCAN_PATHS.keys())
+    selected_categories = list(SCAN_PATHS) if categories is None else categories
 
     for cat_name in selected_categories:
-        if cat_name in SCAN_PATHS:
-            cat_config = SCAN_PATHS[cat_name]
-            for path in cat_config['paths']:
-                paths_to_check.append((path, cat_config))
+        if cat_name in _BY_CAT:
+            for path, template in _FLAT[_BY_CAT[cat_name]]:
+                add_path(path, template)
 
     # Add custom paths
     if custom_paths:
-        custom_config = {
-            'category': 'Custom Path',
-            'severity': 'Medium',
-            'owasp': 'A01:2021 - Broken Access Control',
-            'cwe': 'CWE-538',
-            'description': 'Custom path is accessible.',
-            'recommendation': 'Review if this path should be publicly accessible.',
-        }
         for path in custom_paths:
-            paths_to_check.append((path, custom_config))
+            add_path(path, _CUSTOM_TEMPLATE)
+
+    paths_to_check = list(queued.values())
 
     result.paths_checked = len(paths_to_check)
 
@@ -494,61 +741,108 @@ def scan_directories(
     print(f"[*] Target: {target_url}")
     print(f"[*] Categories: {', '.join(selected_categories)}")
     print(f"[*] Paths to check: {len(paths_to_check)}")
-    print(f"[*] Threads: {max_threads}")
+    # Never start more worker threads than there are paths to probe
+    workers = max(1, min(max_threads, len(paths_to_check)))
+
+    print(f"[*] Threads: {workers}")
     print()
 
+    baseline = None
+    if detect_wildcard:
+        baseline = _calibrate_baseline(target_url, timeout, session)
+        if baseline:
+            result.wildcard_status, result.wildcard_length = baseline
+            print(
+                f"[*] Wildcard responses detected (HTTP {baseline[0]}, "
+                f"~{baseline[1]} bytes); matching responses are ignored"
+            )
+
     # Execute scan with thread pool
     checked_count = 0
+    consecutive_errors = 0
+    pending_lines = []
+
+    def flush_lines():
+        if pending_lines:
+            sys.stdout.write('\n'.join(pending_lines) + '\n')
+            pending_lines.clear()
 
-    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+    found_count = 0
+    # One slot per queued path, filled as probes complete
+    slots: List[Optional[DirectoryFinding]] = [None] * len(paths_to_check)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
         futures = {
             executor.submit(
-                _check_path, target_url, path, config, timeout
-            ): (path, config)
-            for path, config in paths_to_check
+                _check_path, url, path, template, timeout, session, baseline
+            ): (index, path)
+            for index, (url, path, template) in enumerate(paths_to_check)
         }
 
         for future in as_completed(futures):
-            path, config = futures[future]
+            index, path = futures[future]
             checked_count += 1
 
             try:
                 finding = future.result()
+                consecutive_errors = 0
                 if finding:
-                    result.findings.append(finding)
-                    result.paths_found += 1
-
-                    severity_icon = {
-                        'Critical': '[!!]',
-                        'High': '[!]',
-                        'Medium': '[*]',
-                        'Low': '[.]',
-                        'Informational': '[-]',
-                    }.get(finding.severity, '[?]')
-
-                    print(
-                        f"  {severity_icon} FOUND: {finding.path} "
+                    slots[index] = finding
+                    found_count += 1
+
+                    prefix = _FOUND_PREFIX.get(finding.severity, "  [?] FOUND: ")
+                    pending_lines.append(
+                        f"{prefix}{finding.path} "
                         f"(HTTP {finding.status_code}) "
                         f"[{finding.category}] "
                         f"[{finding.severity}]"
                     )
 
                 elif verbose:
-                    print(f"  [-] Not found: {path}")
-
+                    pending_lines.append(f"  [-] Not found: {path}")
+
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout):
+                consecutive_errors += 1
+                if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                    # The target is down or refusing us; drop the paths
+                    # that have not started instead of timing out on each
+                    for pending in futures:
+                        pending.cancel()
+                    result.paths_checked = checked_count
+                    result.errors.append(
+                        f"Scan aborted after {consecutive_errors} consecutive "
+                        f"connection failures"
+                    )
+                    pending_lines.append(
+                        f"  [!] Target unreachable, aborting after "
+                        f"{checked_count}/{len(paths_to_check)} paths"
+                    )
+                    break
             except Exception as e:
                 result.errors.append(f"{path}: {str(e)}")
 
             # Progress update every 50 paths
             if not verbose and checked_count % 50 == 0:
-                print(
+                pending_lines.append(
                     f"  [*] Progress: {checked_count}/{len(paths_to_check)} "
-                    f"paths checked, {result.paths_found} found..."
+                    f"paths checked, {found_count} found..."
                 )
-
-    # Sort findings by severity
-    severity_order = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3, 'Informational': 4}
-    result.findings.sort(key=lambda f: severity_order.get(f.severity, 5))
+                flush_lines()
+            elif len(pending_lines) >= OUTPUT_BATCH_SIZE:
+                flush_lines()
+
+        flush_lines()
+
+    # Sort findings by severity, keeping wordlist order within each level.
+    # Ranks are small integers, so a stable bucket pass replaces the
+    # comparison sort.
+    buckets = [[] for _ in range(len(SEVERITY_RANK) + 1)]
+    for finding in slots:
+        if finding is not None:
+            buckets[finding._severity_rank].append(finding)
+    result.findings = [finding for bucket in buckets for finding in bucket]
+    result.paths_found = len(result.findings)
 
     result.scan_duration = time.time() - start_time
 
@@ -561,6 +855,10 @@ def scan_directories(
     return result
 
 
+# Row layout for format_directory_report, parsed once
+_ROW_FMT = "  {:<30s} {:<8d} {:<22s} {}".format
+
+
 def format_directory_report(result: DirectoryScanResult) -> str:
     """Format the directory scan result as a text report."""
     lines = [
@@ -579,11 +877,10 @@ def format_directory_report(result: DirectoryScanResult) -> str:
         lines.append(f"  {'PATH':<30s} {'STATUS':<8s} {'CATEGORY':<22s} {'SEVERITY'}")
         lines.append("  " + "-" * 75)
 
-        for finding in result.findings:
-            lines.append(
-                f"  {finding.path:<30s} {finding.status_code:<8d} "
-                f"{finding.category:<22s} {finding.severity}"
-            )
+        lines.extend(
+            _ROW_FMT(f.path, f.status_code, f.category, f.severity)
+            for f in result.findings
+        )
     else:
         lines.append("  No exposed directories or files found.")
 
@@ -592,11 +889,12 @@ def format_directory_report(result: DirectoryScanResult) -> str:
 
 
 if __name__ == '__main__':
-    import sys
-
     target = sys.argv[1] if len(sys.argv) > 1 else 'http://127.0.0.1:5000'
     verbose = '--verbose' in sys.argv
 
-    result = scan_directories(target, verbose=verbose)
+    with create_session() as session:
+        result = scan_directories(
+            target, verbose=verbose, session=session, detect_wildcard=True
+        )
     print()
     print(format_directory_report(result))
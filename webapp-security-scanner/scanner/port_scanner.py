@@ -1,13 +1,16 @@
 """
 TCP Port Scanner
 ===================
-A multi-threaded TCP connect scanner for identifying open ports
+A concurrent TCP connect scanner for identifying open ports
 and running services on the target host.
 
 Features:
 - Configurable port range and common port presets
 - Service identification based on port numbers
-- Multi-threaded scanning with configurable thread count
+- Concurrent non-blocking connects on one asyncio event loop, with a
+  thread-pool fallback when called from inside a running loop
+- Configurable concurrency (max_threads caps in-flight probes), with
+  an optional adaptive mode that backs off when probes time out
 - Connection timeout handling
 - Banner grabbing for service version detection
 - Severity classification based on service type
@@ -16,16 +19,24 @@ ETHICAL USE ONLY: Only scan systems you own or have written authorization to tes
 Port scanning without authorization may be illegal in your jurisdiction.
 """
 
+import asyncio
+import errno
+import functools
+import itertools
 import socket
+import sys
 import time
-import threading
+from collections import Counter, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
+from scanner._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PortFinding:
     """Represents an open port finding."""
     port: int
@@ -37,7 +48,7 @@ class PortFinding:
     recommendation: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PortScanResult:
     """Complete result of a port scan."""
     target_host: str
@@ -166,6 +177,55 @@ COMMON_PORTS = {
                               'Never expose MongoDB to the internet.'},
 }
 
+# COMMON_PORTS flattened to (service, severity, description, recommendation)
+# so a probe unpacks one tuple instead of building a fallback dict per port
+_PORT_INFO = {
+    port: (info['service'], info['severity'],
+           info['description'], info['recommendation'])
+    for port, info in COMMON_PORTS.items()
+}
+
+_UNKNOWN_RECOMMENDATION = (
+    'Investigate the purpose of this service and '
+    'ensure it is properly secured.'
+)
+
+# Ports that get an HTTP request as their banner probe. TCP Fast Open is
+# deliberately not used to carry the probe in the SYN: with
+# TCP_FASTOPEN_CONNECT, connect() reports success before any handshake,
+# so closed ports would look open until the first send failed
+_HTTP_PORTS = frozenset({80, 8080, 8443, 8888})
+
+# Services that greet the client unprompted (FTP, SSH, SMTP, POP3, IMAP);
+# their banner is read straight after connect without sending a probe
+_SERVER_FIRST_PORTS = frozenset({21, 22, 25, 110, 143})
+
+# Where the platform supports it (Linux), event-loop probe sockets are
+# created non-blocking by socket(2) itself, saving the ioctl that a
+# separate setblocking(False) costs on every probe
+_SOCK_NONBLOCK = getattr(socket, 'SOCK_NONBLOCK', 0)
+_NONBLOCKING_STREAM = socket.SOCK_STREAM | _SOCK_NONBLOCK
+
+# connect_ex reports a timed-out connect as one of these errno values
+# rather than raising socket.timeout; the event-loop driver sees the same
+# case as asyncio.TimeoutError, and both classify it as filtered
+_CONNECT_TIMEOUT_ERRNOS = frozenset(
+    code for code in (
+        errno.EAGAIN,
+        errno.EWOULDBLOCK,
+        errno.ETIMEDOUT,
+        getattr(errno, 'WSAEWOULDBLOCK', None),
+        getattr(errno, 'WSAETIMEDOUT', None),
+    )
+    if code is not None
+)
+
+# Port states that scan_ports keeps in PortScanResult.findings
+_REPORTED_STATES = frozenset({'open', 'filtered'})
+
+# Seconds to wait for a banner once a port is open
+BANNER_TIMEOUT = 2.0
+
 # Quick scan ports (most common)
 QUICK_SCAN_PORTS = [
     21, 22, 23, 25, 53, 80, 110, 135, 139, 143,
@@ -174,10 +234,13 @@ QUICK_SCAN_PORTS = [
 ]
 
 # Full scan includes additional ports
-FULL_SCAN_PORTS = list(range(1, 1025)) + [
+FULL_SCAN_EXTRAS = (
     1433, 1521, 2049, 3306, 3389, 5432, 5900, 5984,
     6379, 8000, 8080, 8443, 8888, 9090, 9200, 9300,
-    11211, 27017, 50000
+    11211, 27017, 50000,
+)
+FULL_SCAN_PORTS = list(range(1, 1025)) + [
+    port for port in FULL_SCAN_EXTRAS if port > 1024
 ]
 
 
@@ -207,6 +270,100 @@ def _resolve_host(target: str) -> Tuple[str, str]:
     return hostname, ip_address
 
 
+def _banner_probe(port: int) -> Optional[bytes]:
+    """Return the minimal request sent to coax a banner, or None if unneeded."""
+    if port in _SERVER_FIRST_PORTS:
+        return None
+    if port in _HTTP_PORTS:
+        return b'HEAD / HTTP/1.0\r\n\r\n'
+    return b'\r\n'
+
+
+def _decode_banner(banner_data: bytes) -> str:
+    """Decode and truncate a raw banner for display."""
+    if not banner_data:
+        # Silent services (and peers that close straight away) are common
+        return ''
+    banner = banner_data.decode('utf-8', errors='replace').strip()
+    if len(banner) > 200:
+        banner = banner[:200] + '...'
+    return banner
+
+
+def _service_name(port: int) -> str:
+    """Return the service name for a port, or a generic one if unknown."""
+    info = _PORT_INFO.get(port)
+    return info[0] if info is not None else f'unknown-{port}'
+
+
+def _open_finding(port: int, banner: Optional[str]) -> PortFinding:
+    """Build the finding for an open port."""
+    info = _PORT_INFO.get(port)
+    if info is not None:
+        service, severity, description, recommendation = info
+    else:
+        service = f'unknown-{port}'
+        severity = 'Low'
+        description = f'Service detected on port {port}.'
+        recommendation = _UNKNOWN_RECOMMENDATION
+
+    return PortFinding(
+        port=port,
+        state='open',
+        service=service,
+        banner=banner,
+        severity=severity,
+        description=description,
+        recommendation=recommendation,
+    )
+
+
+# Closed ports are most of a full scan and are only counted, never
+# reported, so one (frozen) finding per port number is built and reused
+@functools.lru_cache(maxsize=4096)
+def _closed_finding(port: int) -> PortFinding:
+    """Return the (shared) finding for a closed port."""
+    return PortFinding(
+        port=port,
+        state='closed',
+        service=_service_name(port),
+        banner=None,
+        severity='Informational',
+        description=f'Port {port} is closed.',
+        recommendation='No action needed.',
+    )
+
+
+def _filtered_finding(port: int) -> PortFinding:
+    """Build the finding for a port whose connect timed out."""
+    service = _service_name(port)
+    return PortFinding(
+        port=port,
+        state='filtered',
+        service=service,
+        banner=None,
+        severity='Low',
+        description=(
+            f'Port {port} ({service}) appears to be filtered. '
+            f'A firewall may be blocking the connection.'
+        ),
+        recommendation='Verify firewall rules are intentional.',
+    )
+
+
+def _error_finding(port: int, error: Exception) -> PortFinding:
+    """Build the finding for a port that could not be probed."""
+    return PortFinding(
+        port=port,
+        state='error',
+        service=_service_name(port),
+        banner=None,
+        severity='Informational',
+        description=f'Error scanning port {port}: {str(error)}',
+        recommendation='Check network connectivity.',
+    )
+
+
 def _scan_port(
     host: str,
     port: int,
@@ -223,14 +380,7 @@ def _scan_port(
     Returns:
         PortFinding with the result
     """
-    port_info = COMMON_PORTS.get(port, {
-        'service': f'unknown-{port}',
-        'severity': 'Low',
-        'description': f'Service detected on port {port}.',
-        'recommendation': 'Investigate the purpose of this service and '
-                          'ensure it is properly secured.',
-    })
-
+    sock = None
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(timeout)
@@ -241,65 +391,169 @@ def _scan_port(
             # Port is open - attempt banner grab
             banner = None
             try:
-                sock.settimeout(2.0)
-                # Send a minimal request for banner
-                if port in [80, 8080, 8443, 8888]:
-                    sock.send(b'HEAD / HTTP/1.0\r\n\r\n')
-                else:
-                    sock.send(b'\r\n')
-                banner_data = sock.recv(1024)
-                banner = banner_data.decode('utf-8', errors='replace').strip()
-                if len(banner) > 200:
-                    banner = banner[:200] + '...'
+                # settimeout costs a syscall; the socket is already
+                # non-blocking, so only reset it when the value changes
+                if timeout != BANNER_TIMEOUT:
+                    sock.settimeout(BANNER_TIMEOUT)
+                probe = _banner_probe(port)
+                if probe is not None:
+                    sock.send(probe)
+                banner = _decode_banner(sock.recv(1024))
             except (socket.timeout, ConnectionResetError, OSError):
                 pass
 
-            sock.close()
-
-            return PortFinding(
-                port=port,
-                state='open',
-                service=port_info['service'],
-                banner=banner,
-                severity=port_info['severity'],
-                description=port_info['description'],
-                recommendation=port_info['recommendation'],
-            )
+            return _open_finding(port, banner)
+        elif result in _CONNECT_TIMEOUT_ERRNOS:
+            return _filtered_finding(port)
         else:
-            sock.close()
-            return PortFinding(
-                port=port,
-                state='closed',
-                service=port_info['service'],
-                banner=None,
-                severity='Informational',
-                description=f'Port {port} is closed.',
-                recommendation='No action needed.',
-            )
+            return _closed_finding(port)
 
     except socket.timeout:
-        return PortFinding(
-            port=port,
-            state='filtered',
-            service=port_info['service'],
-            banner=None,
-            severity='Low',
-            description=(
-                f'Port {port} ({port_info["service"]}) appears to be filtered. '
-                f'A firewall may be blocking the connection.'
-            ),
-            recommendation='Verify firewall rules are intentional.',
-        )
+        return _filtered_finding(port)
     except OSError as e:
-        return PortFinding(
-            port=port,
-            state='error',
-            service=port_info['service'],
-            banner=None,
-            severity='Informational',
-            description=f'Error scanning port {port}: {str(e)}',
-            recommendation='Check network connectivity.',
-        )
+        return _error_finding(port, e)
+    finally:
+        # Release the descriptor on every path, including timeouts, so
+        # long scans do not hold sockets until garbage collection
+        if sock is not None:
+            sock.close()
+
+
+async def _scan_port_async(
+    host: str,
+    port: int,
+    timeout: float = 2.0
+) -> PortFinding:
+    """
+    Scan a single port with a non-blocking TCP connect on the event loop.
+
+    Classifies ports the same way as _scan_port: a refused or unreachable
+    connect is closed, a timeout is filtered, and a resolution failure is
+    an error.
+
+    Args:
+        host: Target host IP or hostname
+        port: Port number to scan
+        timeout: Connection timeout in seconds
+
+    Returns:
+        PortFinding with the result
+    """
+    # Raw non-blocking socket driven by the loop's sock_* calls; a closed
+    # port then costs no transport, protocol or stream objects
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, _NONBLOCKING_STREAM)
+    if not _SOCK_NONBLOCK:
+        sock.setblocking(False)
+    try:
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (host, port)), timeout)
+        except asyncio.TimeoutError:
+            return _filtered_finding(port)
+        except socket.gaierror as e:
+            return _error_finding(port, e)
+        except OSError:
+            return _closed_finding(port)
+
+        # Port is open - attempt banner grab
+        banner = None
+        try:
+            probe = _banner_probe(port)
+            if probe is not None:
+                await loop.sock_sendall(sock, probe)
+            banner = _decode_banner(
+                await asyncio.wait_for(loop.sock_recv(sock, 1024), BANNER_TIMEOUT)
+            )
+        except (asyncio.TimeoutError, OSError):
+            pass
+
+        return _open_finding(port, banner)
+    finally:
+        sock.close()
+
+
+class _AdaptiveLimit:
+    """
+    Concurrency limit for event-loop probes that adapts to the target.
+
+    Starts small and grows by one slot per probe that completes without
+    timing out, up to the ceiling. When more than 30% (six) of a 20-probe
+    window time out, a sign of rate limiting or a congested path, the
+    limit is halved. Refused connections are ordinary closed ports and do
+    not count against the limit.
+    """
+
+    WINDOW = 20
+    TIMEOUT_RATIO = 0.3
+
+    def __init__(self, ceiling: int, start: int = 8, floor: int = 4):
+        self.ceiling = ceiling
+        self.floor = min(floor, ceiling)
+        self.limit = min(start, ceiling)
+        self.active = 0
+        self._window = deque(maxlen=self.WINDOW)
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def __aexit__(self, *exc):
+        async with self._cond:
+            self.active -= 1
+            self._cond.notify_all()
+
+    def record(self, timed_out: bool) -> None:
+        """Adjust the limit from one completed probe."""
+        window = self._window
+        window.append(timed_out)
+        if len(window) == self.WINDOW and sum(window) > self.WINDOW * self.TIMEOUT_RATIO:
+            self.limit = max(self.floor, self.limit // 2)
+            window.clear()
+        elif not timed_out and self.limit < self.ceiling:
+            self.limit += 1
+
+
+async def _scan_ports_async(
+    host: str,
+    ports: List[int],
+    timeout: float,
+    concurrency: int,
+    on_finding,
+    adaptive: bool = False
+) -> list:
+    """
+    Probe ports concurrently on one event loop.
+
+    Returns:
+        PortFinding (or the raised exception) for each port, in input order
+    """
+    if adaptive:
+        limiter = _AdaptiveLimit(concurrency)
+    else:
+        limiter = asyncio.Semaphore(concurrency)
+
+    async def probe(port):
+        async with limiter:
+            finding = await _scan_port_async(host, port, timeout)
+        if adaptive:
+            limiter.record(finding.state == 'filtered')
+        on_finding(port, finding)
+        return finding
+
+    return await asyncio.gather(
+        *(probe(port) for port in ports), return_exceptions=True
+    )
+
+
+def _in_event_loop() -> bool:
+    """Return True if an asyncio event loop is running in this thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
 
 def scan_ports(
@@ -308,18 +562,26 @@ def scan_ports(
     scan_type: str = 'quick',
     timeout: float = 2.0,
     max_threads: int = 50,
-    verbose: bool = False
+    verbose: bool = False,
+    adaptive: bool = False
 ) -> PortScanResult:
     """
-    Run a multi-threaded TCP port scan against the target.
+    Run a concurrent TCP port scan against the target.
+
+    Probes run as non-blocking connects on an asyncio event loop. If the
+    caller is already inside a running loop, a thread pool is used instead.
 
     Args:
         target: Target URL or hostname
         ports: Specific ports to scan (overrides scan_type)
         scan_type: 'quick' (common ports) or 'full' (1-1024 + extras)
         timeout: Connection timeout per port in seconds
-        max_threads: Maximum concurrent scanning threads
+        max_threads: Maximum concurrent connection attempts
         verbose: Enable verbose output
+        adaptive: Ramp concurrency up from a few probes and back off when
+            probes start timing out, instead of holding max_threads open.
+            Gentler on rate-limited WAN targets; applies to the event-loop
+            driver only.
 
     Returns:
         PortScanResult with all findings
@@ -342,70 +604,90 @@ def scan_ports(
         scan_ports_list = QUICK_SCAN_PORTS
 
     result.total_ports_scanned = len(scan_ports_list)
+    # Never allow more concurrent probes than there are ports to probe
+    workers = max(1, min(max_threads, len(scan_ports_list)))
+
+    sys.stdout.write(
+        f"[*] Starting port scan...\n"
+        f"[*] Target: {hostname} ({ip_address})\n"
+        f"[*] Scan type: {scan_type}\n"
+        f"[*] Ports to scan: {len(scan_ports_list)}\n"
+        f"[*] Concurrency: {workers}\n"
+        f"[*] Timeout: {timeout}s per port\n"
+        f"\n"
+    )
 
-    print(f"[*] Starting port scan...")
-    print(f"[*] Target: {hostname} ({ip_address})")
-    print(f"[*] Scan type: {scan_type}")
-    print(f"[*] Ports to scan: {len(scan_ports_list)}")
-    print(f"[*] Threads: {max_threads}")
-    print(f"[*] Timeout: {timeout}s per port")
-    print()
-
-    # Thread-safe counter for progress
-    scanned_count = 0
-    count_lock = threading.Lock()
-
-    def scan_with_progress(port):
-        nonlocal scanned_count
-        finding = _scan_port(ip_address, port, timeout)
-        with count_lock:
-            scanned_count += 1
-            if verbose:
-                if finding.state == 'open':
-                    print(f"  [+] Port {port:5d}/tcp  OPEN    {finding.service}")
-                elif finding.state == 'filtered':
-                    print(f"  [?] Port {port:5d}/tcp  FILTERED  {finding.service}")
-            elif scanned_count % 100 == 0:
-                print(f"  [*] Progress: {scanned_count}/{len(scan_ports_list)} ports scanned...")
-        return finding
-
-    # Execute scan with thread pool
-    with ThreadPoolExecutor(max_workers=max_threads) as executor:
-        futures = {
-            executor.submit(scan_with_progress, port): port
-            for port in scan_ports_list
-        }
+    # next() on itertools.count is a single C-level step, so worker
+    # threads can take progress numbers without a lock; each line goes
+    # out in one write so concurrent lines do not interleave
+    progress = itertools.count(1)
+    total = len(scan_ports_list)
+
+    def report_progress(port, finding):
+        scanned_count = next(progress)
+        if verbose:
+            if finding.state == 'open':
+                sys.stdout.write(f"  [+] Port {port:5d}/tcp  OPEN    {finding.service}\n")
+            elif finding.state == 'filtered':
+                sys.stdout.write(f"  [?] Port {port:5d}/tcp  FILTERED  {finding.service}\n")
+        elif scanned_count % 100 == 0:
+            sys.stdout.write(f"  [*] Progress: {scanned_count}/{total} ports scanned...\n")
+
+    if not _in_event_loop():
+        outcomes = zip(scan_ports_list, asyncio.run(_scan_ports_async(
+            ip_address, scan_ports_list, timeout, workers, report_progress,
+            adaptive=adaptive,
+        )))
+    else:
+        def scan_with_progress(port):
+            finding = _scan_port(ip_address, port, timeout)
+            report_progress(port, finding)
+            return finding
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(scan_with_progress, port): port
+                for port in scan_ports_list
+            }
+            outcomes = []
+            for future in as_completed(futures):
+                try:
+                    outcomes.append((futures[future], future.result()))
+                except Exception as e:
+                    outcomes.append((futures[future], e))
+
+    findings = []
+    for port, finding in outcomes:
+        if isinstance(finding, BaseException):
+            result.errors.append(f"Port {port}: {str(finding)}")
+        else:
+            findings.append(finding)
 
-        for future in as_completed(futures):
-            port = futures[future]
-            try:
-                finding = future.result()
-                if finding.state == 'open':
-                    result.findings.append(finding)
-                    result.open_ports.append(finding.port)
-                elif finding.state == 'closed':
-                    result.closed_ports += 1
-                elif finding.state == 'filtered':
-                    result.filtered_ports += 1
-                    result.findings.append(finding)
-            except Exception as e:
-                result.errors.append(f"Port {port}: {str(e)}")
+    # Tally states in one C-level pass; only open and filtered ports are
+    # reported as findings
+    state_counts = Counter(map(attrgetter('state'), findings))
+    result.closed_ports = state_counts['closed']
+    result.filtered_ports = state_counts['filtered']
+    result.findings = [f for f in findings if f.state in _REPORTED_STATES]
+    result.open_ports = [f.port for f in result.findings if f.state == 'open']
 
     # Sort findings by port number
-    result.findings.sort(key=lambda f: f.port)
+    result.findings.sort(key=attrgetter('port'))
     result.open_ports.sort()
 
     result.scan_duration = time.time() - start_time
 
-    print()
-    print(f"[*] Port scan complete")
-    print(f"[*] Duration: {result.scan_duration:.2f}s")
-    print(f"[*] Open ports: {len(result.open_ports)}")
-    print(f"[*] Closed ports: {result.closed_ports}")
-    print(f"[*] Filtered ports: {result.filtered_ports}")
-
+    summary = (
+        f"\n"
+        f"[*] Port scan complete\n"
+        f"[*] Duration: {result.scan_duration:.2f}s\n"
+        f"[*] Open ports: {len(result.open_ports)}\n"
+        f"[*] Closed ports: {result.closed_ports}\n"
+        f"[*] Filtered ports: {result.filtered_ports}\n"
+    )
     if result.open_ports:
-        print(f"[*] Open ports: {', '.join(str(p) for p in result.open_ports)}")
+        summary += f"[*] Open ports: {', '.join(map(str, result.open_ports))}\n"
+    sys.stdout.write(summary)
 
     return result
 
@@ -442,8 +724,6 @@ def format_port_report(result: PortScanResult) -> str:
 
 
 if __name__ == '__main__':
-    import sys
-
     target = sys.argv[1] if len(sys.argv) > 1 else 'http://127.0.0.1:5000'
     verbose = '--verbose' in sys.argv
     scan_type = 'full' if '--full' in sys.argv else 'quick'
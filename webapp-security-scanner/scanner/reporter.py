@@ -17,14 +17,33 @@ ETHICAL USE ONLY: Reports should be shared only with authorized stakeholders.
 """
 
 import os
+import sys
 import json
+from collections import Counter
+from itertools import chain
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
+from operator import attrgetter
 from typing import List, Dict, Optional, Any
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+from markupsafe import Markup
 
+from scanner._compat import DATACLASS_SLOTS
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@dataclass(**DATACLASS_SLOTS)
 class VulnerabilityEntry:
     """Normalized vulnerability entry for reporting."""
     title: str
@@ -42,7 +61,7 @@ class VulnerabilityEntry:
     raw_data: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ScanReport:
     """Complete scan report data structure."""
     target_url: str
@@ -58,6 +77,18 @@ class ScanReport:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# VulnerabilityEntry fields exported to JSON reports, in declaration order
+_VULN_FIELDS = tuple(
+    f.name for f in fields(VulnerabilityEntry)
+    if f.name not in ('cvss_score', 'raw_data')
+)
+
+
+_SEP = '=' * 70
+
+# Report ordering of severity levels, most severe first
+SEVERITY_ORDER = ('Critical', 'High', 'Medium', 'Low', 'Informational')
+
 # Severity weights for risk scoring
 SEVERITY_WEIGHTS = {
     'Critical': 10.0,
@@ -75,6 +106,161 @@ SEVERITY_COLORS = {
     'Informational': '#3498db',
 }
 
+# The colour table is fixed and trusted, so it is marked safe once here
+# instead of being escaped on every render. Finding fields stay escaped.
+_SAFE_SEVERITY_COLORS = {
+    severity: Markup(color) for severity, color in SEVERITY_COLORS.items()
+}
+
+DEFAULT_TEMPLATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'reports'
+)
+REPORT_TEMPLATE = 'template.html'
+
+# One Environment per template directory, plus the compiled report
+# template. auto_reload=False skips the per-render stat() of the source.
+_ENV_CACHE: Dict[str, Environment] = {}
+_TEMPLATE_CACHE: Dict[tuple, Template] = {}
+
+
+# Compiled template bytecode persists on disk so fresh CLI processes skip
+# parsing template.html. Jinja's default directory is per-user and created
+# 0700, so another local user cannot plant bytecode for us to load.
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Return a disk bytecode cache, or None if no usable directory exists."""
+    try:
+        cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+    if not os.access(cache.directory, os.W_OK):
+        return None
+    return cache
+
+
+def _get_template(template_dir: str, name: str = REPORT_TEMPLATE) -> Template:
+    """Return the compiled template, building its Environment on first use."""
+    key = (template_dir, name)
+    template = _TEMPLATE_CACHE.get(key)
+    if template is None:
+        env = _ENV_CACHE.get(template_dir)
+        if env is None:
+            env = Environment(
+                loader=FileSystemLoader(template_dir),
+                autoescape=select_autoescape(['html']),
+                auto_reload=False,
+                cache_size=50,
+                bytecode_cache=_bytecode_cache(),
+            )
+            _ENV_CACHE[template_dir] = env
+        template = _TEMPLATE_CACHE[key] = env.get_template(name)
+    return template
+
+
+def _header_entry(finding, results) -> Optional[VulnerabilityEntry]:
+    """Normalize a header finding: missing headers and information disclosure."""
+    if not finding.present:
+        return VulnerabilityEntry(
+            title=f'Missing Security Header: {finding.header_name}',
+            severity=finding.severity,
+            category='Security Misconfiguration',
+            description=finding.description,
+            evidence='Header not present in HTTP response',
+            remediation=finding.recommendation,
+            url=results.target_url,
+            owasp_category=finding.owasp_category,
+            cwe_id=finding.cwe_id,
+            module='header_check',
+        )
+    if finding.severity != 'Informational':
+        # Information disclosure headers
+        return VulnerabilityEntry(
+            title=f'Information Disclosure: {finding.header_name}',
+            severity=finding.severity,
+            category='Information Disclosure',
+            description=finding.description,
+            evidence=f'Header value: {finding.value}',
+            remediation=finding.recommendation,
+            url=results.target_url,
+            owasp_category=finding.owasp_category,
+            cwe_id=finding.cwe_id,
+            module='header_check',
+        )
+    return None
+
+
+def _sqli_entry(finding, results) -> VulnerabilityEntry:
+    """Normalize a SQL injection finding."""
+    return VulnerabilityEntry(
+        title=f'SQL Injection ({finding.injection_type}): {finding.parameter}',
+        severity=finding.severity,
+        category='Injection',
+        description=finding.description,
+        evidence=finding.evidence,
+        remediation=finding.remediation,
+        url=finding.url,
+        parameter=finding.parameter,
+        owasp_category=finding.owasp_category,
+        cwe_id=finding.cwe_id,
+        module='sqli_scanner',
+        raw_data={'payload': finding.payload, 'method': finding.method},
+    )
+
+
+def _xss_entry(finding, results) -> VulnerabilityEntry:
+    """Normalize a cross-site scripting finding."""
+    return VulnerabilityEntry(
+        title=f'Cross-Site Scripting ({finding.xss_type}): {finding.parameter}',
+        severity=finding.severity,
+        category='Cross-Site Scripting',
+        description=finding.description,
+        evidence=finding.evidence,
+        remediation=finding.remediation,
+        url=finding.url,
+        parameter=finding.parameter,
+        owasp_category=finding.owasp_category,
+        cwe_id=finding.cwe_id,
+        module='xss_scanner',
+        raw_data={'payload': finding.payload, 'context': finding.context},
+    )
+
+
+def _port_entry(finding, results) -> Optional[VulnerabilityEntry]:
+    """Normalize an open, non-informational port finding."""
+    if finding.state != 'open' or finding.severity == 'Informational':
+        return None
+    return VulnerabilityEntry(
+        title=f'Open Port: {finding.port}/tcp ({finding.service})',
+        severity=finding.severity,
+        category='Network Security',
+        description=finding.description,
+        evidence=(
+            f'Port {finding.port}/tcp is open. '
+            f'Banner: {finding.banner or "N/A"}'
+        ),
+        remediation=finding.recommendation,
+        url=f'{results.target_host}:{finding.port}',
+        module='port_scanner',
+    )
+
+
+def _directory_entry(finding, results) -> VulnerabilityEntry:
+    """Normalize an exposed path finding."""
+    return VulnerabilityEntry(
+        title=f'Exposed {finding.category}: {finding.path}',
+        severity=finding.severity,
+        category=finding.category,
+        description=finding.description,
+        evidence=(
+            f'HTTP {finding.status_code} response for {finding.url} '
+            f'(Content-Length: {finding.content_length} bytes)'
+        ),
+        remediation=finding.recommendation,
+        url=finding.url,
+        owasp_category=finding.owasp_category,
+        cwe_id=finding.cwe_id,
+        module='directory_scanner',
+    )
+
 
 def normalize_findings(
     header_results=None,
@@ -97,159 +283,77 @@ def normalize_findings(
         List of normalized VulnerabilityEntry objects
     """
     vulnerabilities = []
+    for results, builder in (
+        (header_results, _header_entry),
+        (sqli_results, _sqli_entry),
+        (xss_results, _xss_entry),
+        (port_results, _port_entry),
+        (directory_results, _directory_entry),
+    ):
+        if results:
+            vulnerabilities.extend(filter(None, (
+                builder(finding, results) for finding in results.findings
+            )))
+
+    # Order by severity with a stable bucket pass; unknown severities last
+    buckets = {severity: [] for severity in SEVERITY_ORDER}
+    other = []
+    for vuln in vulnerabilities:
+        buckets.get(vuln.severity, other).append(vuln)
 
-    # Normalize header findings
-    if header_results:
-        for finding in header_results.findings:
-            if finding.severity != 'Informational' or not finding.present:
-                if not finding.present:
-                    vulnerabilities.append(VulnerabilityEntry(
-                        title=f'Missing Security Header: {finding.header_name}',
-                        severity=finding.severity,
-                        category='Security Misconfiguration',
-                        description=finding.description,
-                        evidence=f'Header not present in HTTP response',
-                        remediation=finding.recommendation,
-                        url=header_results.target_url,
-                        owasp_category=finding.owasp_category,
-                        cwe_id=finding.cwe_id,
-                        module='header_check',
-                    ))
-                elif finding.severity != 'Informational':
-                    # Information disclosure headers
-                    vulnerabilities.append(VulnerabilityEntry(
-                        title=f'Information Disclosure: {finding.header_name}',
-                        severity=finding.severity,
-                        category='Information Disclosure',
-                        description=finding.description,
-                        evidence=f'Header value: {finding.value}',
-                        remediation=finding.recommendation,
-                        url=header_results.target_url,
-                        owasp_category=finding.owasp_category,
-                        cwe_id=finding.cwe_id,
-                        module='header_check',
-                    ))
-
-    # Normalize SQL injection findings
-    if sqli_results:
-        for finding in sqli_results.findings:
-            vulnerabilities.append(VulnerabilityEntry(
-                title=f'SQL Injection ({finding.injection_type}): {finding.parameter}',
-                severity=finding.severity,
-                category='Injection',
-                description=finding.description,
-                evidence=finding.evidence,
-                remediation=finding.remediation,
-                url=finding.url,
-                parameter=finding.parameter,
-                owasp_category=finding.owasp_category,
-                cwe_id=finding.cwe_id,
-                module='sqli_scanner',
-                raw_data={'payload': finding.payload, 'method': finding.method},
-            ))
-
-    # Normalize XSS findings
-    if xss_results:
-        for finding in xss_results.findings:
-            vulnerabilities.append(VulnerabilityEntry(
-                title=f'Cross-Site Scripting ({finding.xss_type}): {finding.parameter}',
-                severity=finding.severity,
-                category='Cross-Site Scripting',
-                description=finding.description,
-                evidence=finding.evidence,
-                remediation=finding.remediation,
-                url=finding.url,
-                parameter=finding.parameter,
-                owasp_category=finding.owasp_category,
-                cwe_id=finding.cwe_id,
-                module='xss_scanner',
-                raw_data={'payload': finding.payload, 'context': finding.context},
-            ))
-
-    # Normalize port scan findings
-    if port_results:
-        for finding in port_results.findings:
-            if finding.state == 'open' and finding.severity not in ('Informational',):
-                vulnerabilities.append(VulnerabilityEntry(
-                    title=f'Open Port: {finding.port}/tcp ({finding.service})',
-                    severity=finding.severity,
-                    category='Network Security',
-                    description=finding.description,
-                    evidence=(
-                        f'Port {finding.port}/tcp is open. '
-                        f'Banner: {finding.banner or "N/A"}'
-                    ),
-                    remediation=finding.recommendation,
-                    url=f'{port_results.target_host}:{finding.port}',
-                    module='port_scanner',
-                ))
-
-    # Normalize directory scan findings
-    if directory_results:
-        for finding in directory_results.findings:
-            vulnerabilities.append(VulnerabilityEntry(
-                title=f'Exposed {finding.category}: {finding.path}',
-                severity=finding.severity,
-                category=finding.category,
-                description=finding.description,
-                evidence=(
-                    f'HTTP {finding.status_code} response for {finding.url} '
-                    f'(Content-Length: {finding.content_length} bytes)'
-                ),
-                remediation=finding.recommendation,
-                url=finding.url,
-                owasp_category=finding.owasp_category,
-                cwe_id=finding.cwe_id,
-                module='directory_scanner',
-            ))
-
-    # Sort by severity
-    severity_order = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3, 'Informational': 4}
-    vulnerabilities.sort(key=lambda v: severity_order.get(v.severity, 5))
-
-    return vulnerabilities
+    return list(chain.from_iterable(buckets.values())) + other
 
 
-def calculate_risk_score(vulnerabilities: List[VulnerabilityEntry]) -> float:
-    """
-    Calculate an overall risk score based on vulnerability findings.
+def _format_timestamp(moment: datetime) -> str:
+    """Format as 'YYYY-MM-DD HH:MM:SS' without going through strftime."""
+    return moment.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
 
-    Score range: 0.0 (no risk) to 10.0 (critical risk)
-    """
-    if not vulnerabilities:
+
+def _severity_counts(vulnerabilities: List[VulnerabilityEntry]) -> Counter:
+    """Tally findings per severity in a single pass."""
+    return Counter(map(attrgetter('severity'), vulnerabilities))
+
+
+def _risk_from_counts(counts: Counter, total: int) -> float:
+    """Risk score from severity counts; see calculate_risk_score."""
+    if not total:
         return 0.0
 
     total_weight = sum(
-        SEVERITY_WEIGHTS.get(v.severity, 0) for v in vulnerabilities
+        SEVERITY_WEIGHTS.get(severity, 0) * n for severity, n in counts.items()
     )
 
     # Normalize to 0-10 scale with diminishing returns
     # More vulnerabilities increase the score but with diminishing impact
-    max_theoretical = len(vulnerabilities) * 10.0
-    normalized = (total_weight / max_theoretical) * 10.0 if max_theoretical > 0 else 0.0
+    max_theoretical = total * 10.0
+    normalized = (total_weight / max_theoretical) * 10.0
 
     # Cap at 10.0
     return min(round(normalized, 1), 10.0)
 
 
-def generate_summary(vulnerabilities: List[VulnerabilityEntry]) -> Dict[str, int]:
-    """Generate a severity count summary."""
-    summary = {
-        'Critical': 0,
-        'High': 0,
-        'Medium': 0,
-        'Low': 0,
-        'Informational': 0,
-        'Total': len(vulnerabilities),
-    }
-
-    for vuln in vulnerabilities:
-        if vuln.severity in summary:
-            summary[vuln.severity] += 1
+def _summary_from_counts(counts: Counter, total: int) -> Dict[str, int]:
+    """Severity summary from severity counts; see generate_summary."""
+    summary = {severity: counts[severity] for severity in SEVERITY_ORDER}
+    summary['Total'] = total
 
     return summary
 
 
+def calculate_risk_score(vulnerabilities: List[VulnerabilityEntry]) -> float:
+    """
+    Calculate an overall risk score based on vulnerability findings.
+
+    Score range: 0.0 (no risk) to 10.0 (critical risk)
+    """
+    return _risk_from_counts(_severity_counts(vulnerabilities), len(vulnerabilities))
+
+
+def generate_summary(vulnerabilities: List[VulnerabilityEntry]) -> Dict[str, int]:
+    """Generate a severity count summary."""
+    return _summary_from_counts(_severity_counts(vulnerabilities), len(vulnerabilities))
+
+
 def build_report(
     target_url: str,
     scan_start: datetime,
@@ -288,14 +392,16 @@ def build_report(
         directory_results=directory_results,
     )
 
-    summary = generate_summary(vulnerabilities)
-    risk_score = calculate_risk_score(vulnerabilities)
+    # One tally feeds both the summary and the risk score
+    counts = _severity_counts(vulnerabilities)
+    summary = _summary_from_counts(counts, len(vulnerabilities))
+    risk_score = _risk_from_counts(counts, len(vulnerabilities))
     duration = (scan_end - scan_start).total_seconds()
 
     report = ScanReport(
         target_url=target_url,
-        scan_start=scan_start.strftime('%Y-%m-%d %H:%M:%S'),
-        scan_end=scan_end.strftime('%Y-%m-%d %H:%M:%S'),
+        scan_start=_format_timestamp(scan_start),
+        scan_end=_format_timestamp(scan_end),
         scan_duration=round(duration, 2),
         modules_executed=modules_executed,
         vulnerabilities=vulnerabilities,
@@ -306,13 +412,22 @@ def build_report(
             'scanner_name': 'Web Application Security Scanner',
             'scanner_version': '1.0.0',
             'target_url': target_url,
-            'report_generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'report_generated': _format_timestamp(datetime.now()),
         },
     )
 
     return report
 
 
+def _prepare_output_path(output_path: str) -> str:
+    """Resolve the report path and create its directory if it is missing."""
+    abs_output = os.path.abspath(output_path)
+    out_dir = os.path.dirname(abs_output)
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir, exist_ok=True)
+    return abs_output
+
+
 def render_html_report(
     report: ScanReport,
     output_path: str,
@@ -329,17 +444,7 @@ def render_html_report(
     Returns:
         Path to the generated report file
     """
-    if template_dir is None:
-        template_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 'reports'
-        )
-
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=select_autoescape(['html']),
-    )
-
-    template = env.get_template('template.html')
+    template = _get_template(template_dir or DEFAULT_TEMPLATE_DIR)
 
     # Prepare template data
     template_data = {
@@ -347,7 +452,7 @@ def render_html_report(
         'vulnerabilities': report.vulnerabilities,
         'summary': report.summary,
         'risk_score': report.risk_score,
-        'severity_colors': SEVERITY_COLORS,
+        'severity_colors': _SAFE_SEVERITY_COLORS,
         'scan_start': report.scan_start,
         'scan_end': report.scan_end,
         'scan_duration': report.scan_duration,
@@ -355,19 +460,32 @@ def render_html_report(
         'modules_executed': report.modules_executed,
         'total_requests': report.total_requests,
         'metadata': report.metadata,
-        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'generated_at': _format_timestamp(datetime.now()),
     }
 
-    html_content = template.render(**template_data)
+    abs_output = _prepare_output_path(output_path)
 
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    # Stream rendered chunks to disk rather than building the whole page
+    with open(abs_output, 'w', encoding='utf-8') as f:
+        template.stream(**template_data).dump(f)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    print(f"[+] HTML report saved to: {abs_output}")
+    return abs_output
 
-    print(f"[+] HTML report saved to: {os.path.abspath(output_path)}")
-    return os.path.abspath(output_path)
+
+def _write_json(data: Dict[str, Any], f) -> None:
+    """
+    Write report data to a binary file as indented UTF-8 JSON.
+
+    orjson serializes in one C call when available; otherwise the stdlib
+    encoder's chunks are written as they are produced.
+    """
+    if ORJSON_AVAILABLE:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    for chunk in encoder.iterencode(data):
+        f.write(chunk.encode('utf-8'))
 
 
 def render_json_report(report: ScanReport, output_path: str) -> str:
@@ -392,54 +510,23 @@ def render_json_report(report: ScanReport, output_path: str) -> str:
         'risk_score': report.risk_score,
         'summary': report.summary,
         'total_requests': report.total_requests,
-        'vulnerabilities': [],
+        'vulnerabilities': [
+            {name: getattr(vuln, name) for name in _VULN_FIELDS}
+            for vuln in report.vulnerabilities
+        ],
     }
 
-    for vuln in report.vulnerabilities:
-        vuln_dict = {
-            'title': vuln.title,
-            'severity': vuln.severity,
-            'category': vuln.category,
-            'description': vuln.description,
-            'evidence': vuln.evidence,
-            'remediation': vuln.remediation,
-            'url': vuln.url,
-            'parameter': vuln.parameter,
-            'owasp_category': vuln.owasp_category,
-            'cwe_id': vuln.cwe_id,
-            'module': vuln.module,
-        }
-        report_dict['vulnerabilities'].append(vuln_dict)
+    abs_output = _prepare_output_path(output_path)
 
-    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(abs_output, 'wb') as f:
+        _write_json(report_dict, f)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(report_dict, f, indent=2, ensure_ascii=False)
-
-    print(f"[+] JSON report saved to: {os.path.abspath(output_path)}")
-    return os.path.abspath(output_path)
+    print(f"[+] JSON report saved to: {abs_output}")
+    return abs_output
 
 
 def print_summary(report: ScanReport):
     """Print a formatted summary to the console."""
-    print()
-    print("=" * 70)
-    print("  SCAN SUMMARY")
-    print("=" * 70)
-    print(f"  Target:     {report.target_url}")
-    print(f"  Duration:   {report.scan_duration}s")
-    print(f"  Modules:    {', '.join(report.modules_executed)}")
-    print(f"  Risk Score: {report.risk_score}/10.0")
-    print()
-    print("  VULNERABILITY SUMMARY:")
-    print(f"    Critical:      {report.summary.get('Critical', 0)}")
-    print(f"    High:          {report.summary.get('High', 0)}")
-    print(f"    Medium:        {report.summary.get('Medium', 0)}")
-    print(f"    Low:           {report.summary.get('Low', 0)}")
-    print(f"    Informational: {report.summary.get('Informational', 0)}")
-    print(f"    Total:         {report.summary.get('Total', 0)}")
-    print("=" * 70)
-
     # Risk assessment
     if report.risk_score >= 8.0:
         risk_level = "CRITICAL - Immediate action required"
@@ -452,5 +539,26 @@ def print_summary(report: ScanReport):
     else:
         risk_level = "MINIMAL - Continue regular security practices"
 
-    print(f"  RISK LEVEL: {risk_level}")
-    print("=" * 70)
+    summary = report.summary
+    sys.stdout.write(
+        f"\n"
+        f"{_SEP}\n"
+        f"  SCAN SUMMARY\n"
+        f"{_SEP}\n"
+        f"  Target:     {report.target_url}\n"
+        f"  Duration:   {report.scan_duration}s\n"
+        f"  Modules:    {', '.join(report.modules_executed)}\n"
+        f"  Risk Score: {report.risk_score}/10.0\n"
+        f"\n"
+        f"  VULNERABILITY SUMMARY:\n"
+        f"    Critical:      {summary.get('Critical', 0)}\n"
+        f"    High:          {summary.get('High', 0)}\n"
+        f"    Medium:        {summary.get('Medium', 0)}\n"
+        f"    Low:           {summary.get('Low', 0)}\n"
+        f"    Informational: {summary.get('Informational', 0)}\n"
+        f"    Total:         {summary.get('Total', 0)}\n"
+        f"{_SEP}\n"
+        f"  RISK LEVEL: {risk_level}\n"
+        f"{_SEP}\n"
+    )
+    sys.stdout.flush()
@@ -176,25 +176,27 @@ def _test_error_based(
     param_name: str,
     method: str = 'POST',
     timeout: int = 10,
-    verbose: bool = False
+    verbose: bool = False,
+    session: Optional[requests.Session] = None
 ) -> List[SQLiFinding]:
     """
     Test for error-based SQL injection.
     Sends payloads and checks for SQL error messages in the response.
     """
     findings = []
+    http = session or requests
 
     for payload in ERROR_BASED_PAYLOADS:
         try:
             if method.upper() == 'POST':
-                response = requests.post(
+                response = http.post(
                     url,
                     data={param_name: payload},
                     timeout=timeout,
                     allow_redirects=False
                 )
             else:
-                response = requests.get(
+                response = http.get(
                     url,
                     params={param_name: payload},
                     timeout=timeout,
@@ -248,37 +250,39 @@ def _test_boolean_blind(
     param_name: str,
     method: str = 'POST',
     timeout: int = 10,
-    verbose: bool = False
+    verbose: bool = False,
+    session: Optional[requests.Session] = None
 ) -> List[SQLiFinding]:
     """
     Test for boolean-based blind SQL injection.
     Compares responses between true and false conditions.
     """
     findings = []
+    http = session or requests
 
     for true_payload, false_payload in BOOLEAN_BLIND_PAYLOADS:
         try:
             if method.upper() == 'POST':
-                true_response = requests.post(
+                true_response = http.post(
                     url,
                     data={param_name: true_payload},
                     timeout=timeout,
                     allow_redirects=False
                 )
-                false_response = requests.post(
+                false_response = http.post(
                     url,
                     data={param_name: false_payload},
                     timeout=timeout,
                     allow_redirects=False
                 )
             else:
-                true_response = requests.get(
+                true_response = http.get(
                     url,
                     params={param_name: true_payload},
                     timeout=timeout,
                     allow_redirects=False
                 )
-                false_response = requests.get(
+                false_response = http.get(
                     url,
                     params={param_name: false_payload},
                     timeout=timeout,
@@ -339,21 +343,23 @@ def _test_time_based(
     method: str = 'POST',
     timeout: int = 15,
     delay_threshold: float = 2.5,
-    verbose: bool = False
+    verbose: bool = False,
+    session: Optional[requests.Session] = None
 ) -> List[SQLiFinding]:
     """
     Test for time-based blind SQL injection.
     Measures response time differences with sleep payloads.
     """
     findings = []
+    http = session or requests
 
     # Get baseline response time
     try:
         start = time.time()
         if method.upper() == 'POST':
-            requests.post(url, data={param_name: 'test'}, timeout=timeout)
+            http.post(url, data={param_name: 'test'}, timeout=timeout)
         else:
-            requests.get(url, params={param_name: 'test'}, timeout=timeout)
+            http.get(url, params={param_name: 'test'}, timeout=timeout)
         baseline_time = time.time() - start
     except requests.exceptions.RequestException:
         return findings
@@ -362,13 +368,13 @@ def _test_time_based(
         try:
             start = time.time()
             if method.upper() == 'POST':
-                requests.post(
+                http.post(
                     url,
                     data={param_name: payload},
                     timeout=timeout
                 )
             else:
-                requests.get(
+                http.get(
                     url,
                     params={param_name: payload},
                     timeout=timeout
@@ -441,16 +447,18 @@ def _test_auth_bypass(
     username_param: str = 'username',
     password_param: str = 'password',
     timeout: int = 10,
-    verbose: bool = False
+    verbose: bool = False,
+    session: Optional[requests.Session] = None
 ) -> List[SQLiFinding]:
     """
     Test login form for SQL injection authentication bypass.
     """
     findings = []
+    http = session or requests
 
     # Get the normal failed login response for comparison
     try:
-        normal_response = requests.post(
+        normal_response = http.post(
             login_url,
             data={username_param: 'nonexistentuser', password_param: 'wrongpassword'},
             timeout=timeout,
@@ -463,7 +471,7 @@ def _test_auth_bypass(
 
     for username_payload, password_payload in AUTH_BYPASS_PAYLOADS:
         try:
-            response = requests.post(
+            response = http.post(
                 login_url,
                 data={
                     username_param: username_payload,
@@ -566,7 +574,8 @@ def scan_sqli(
     target_url: str,
     endpoints: Optional[List[Dict]] = None,
     timeout: int = 10,
-    verbose: bool = False
+    verbose: bool = False,
+    session: Optional[requests.Session] = None
 ) -> SQLiScanResult:
     """
     Run a comprehensive SQL injection scan against the target.
@@ -578,6 +587,7 @@ def scan_sqli(
                    If None, uses default endpoints.
         timeout: Request timeout in seconds
         verbose: Enable verbose output
+        session: Optional requests.Session to reuse pooled connections
 
     Returns:
         SQLiScanResult with all findings
@@ -636,6 +646,7 @@ def scan_sqli(
                 password_param=endpoint.get('password_param', 'password'),
                 timeout=timeout,
                 verbose=verbose,
+                session=session,
             )
             result.findings.extend(auth_findings)
             result.payloads_sent += len(AUTH_BYPASS_PAYLOADS)
@@ -645,7 +656,7 @@ def scan_sqli(
             # Error-based testing
             print(f"  [*] Error-based testing: {param}")
             error_findings = _test_error_based(
-                url, param, method, timeout, verbose
+                url, param, method, timeout, verbose, session=session
             )
             result.findings.extend(error_findings)
             result.payloads_sent += len(ERROR_BASED_PAYLOADS)
@@ -653,7 +664,7 @@ def scan_sqli(
             # Boolean-based blind testing
             print(f"  [*] Boolean-blind testing: {param}")
             boolean_findings = _test_boolean_blind(
-                url, param, method, timeout, verbose
+                url, param, method, timeout, verbose, session=session
             )
             result.findings.extend(boolean_findings)
             result.payloads_sent += len(BOOLEAN_BLIND_PAYLOADS) * 2
@@ -661,7 +672,7 @@ def scan_sqli(
             # Time-based blind testing (slower, so done last)
             print(f"  [*] Time-based testing: {param}")
             time_findings = _test_time_based(
-                url, param, method, timeout, verbose=verbose
+                url, param, method, timeout, verbose=verbose, session=session
             )
             result.findings.extend(time_findings)
             result.payloads_sent += len(TIME_BASED_PAYLOADS)
@@ -234,7 +234,8 @@ def _test_reflected_xss(
     method: str = 'POST',
     additional_params: Optional[Dict] = None,
     timeout: int = 10,
-    verbose: bool = False
+    verbose: bool = False,
+    session: Optional[requests.Session] = None
 ) -> List[XSSFinding]:
     """
     Test a single parameter for reflected XSS.
@@ -246,12 +247,14 @@ def _test_reflected_xss(
         additional_params: Additional form parameters to include
         timeout: Request timeout
         verbose: Verbose output
+        session: Optional requests.Session to reuse pooled connections
 
     Returns:
         List of XSSFinding objects
     """
     findings = []
     all_payloads = _get_all_payloads()
+    http = session or requests
 
     for payload, category in all_payloads:
         try:
@@ -261,14 +264,14 @@ def _test_reflected_xss(
                 params.update(additional_params)
 
             if method.upper() == 'POST':
-                response = requests.post(
+                response = http.post(
                     url,
                     data=params,
                     timeout=timeout,
                     allow_redirects=False
                 )
             else:
-                response = requests.get(
+                response = http.get(
                     url,
                     params=params,
                     timeout=timeout,
@@ -342,7 +345,8 @@ def scan_xss(
     target_url: str,
     endpoints: Optional[List[Dict]] = None,
     timeout: int = 10,
-    verbose: bool = False
+    verbose: bool = False,
+    session: Optional[requests.Session] = None
 ) -> XSSScanResult:
     """
     Run a comprehensive XSS scan against the target.
@@ -355,6 +359,7 @@ def scan_xss(
                    If None, uses default endpoints.
         timeout: Request timeout in seconds
         verbose: Enable verbose output
+        session: Optional requests.Session to reuse pooled connections
 
     Returns:
         XSSScanResult with all findings
@@ -408,6 +413,7 @@ def scan_xss(
                 additional_params=additional,
                 timeout=timeout,
                 verbose=verbose,
+                session=session,
             )
             result.findings.extend(param_findings)
             result.payloads_sent += total_payloads
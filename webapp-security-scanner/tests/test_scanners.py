@@ -8,26 +8,39 @@ Uses pytest with mocking to avoid requiring a live target.
 Run with: python -m pytest tests/test_scanners.py -v
 """
 
+import asyncio
 import os
 import sys
+import dataclasses
+import errno
 import json
 import socket
+import ssl
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime
-from unittest.mock import patch, MagicMock, PropertyMock
+from unittest.mock import patch, AsyncMock, MagicMock, PropertyMock
 
 import pytest
+import requests
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from scanner import header_check, reporter
 from scanner.header_check import (
     check_headers,
+    check_headers_batch,
+    check_headers_cached,
     HeaderFinding,
     HeaderCheckResult,
     get_missing_headers,
     get_findings_by_severity,
+    group_by_severity,
     format_header_report,
+    to_json,
     SECURITY_HEADERS,
 )
 from scanner.sqli_scanner import (
@@ -51,12 +64,20 @@ from scanner.port_scanner import (
     scan_ports,
     PortFinding,
     PortScanResult,
+    _AdaptiveLimit,
+    _decode_banner,
     _resolve_host,
     _scan_port,
     COMMON_PORTS,
+    FULL_SCAN_PORTS,
     QUICK_SCAN_PORTS,
 )
 from scanner.directory_scanner import (
+    MAX_BODY_READ,
+    MAX_CONSECUTIVE_ERRORS,
+    _body_length,
+    create_session,
+    format_directory_report,
     scan_directories,
     DirectoryFinding,
     DirectoryScanResult,
@@ -262,6 +283,228 @@ class TestHeaderCheck:
 
         assert result.status_code == 0
 
+    @patch('scanner.header_check.requests.get')
+    def test_check_headers_case_insensitive(self, mock_get):
+        """Test that header names are matched regardless of case."""
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {
+            'strict-transport-security': 'max-age=31536000',
+            'X-FRAME-OPTIONS': 'DENY',
+            'x-powered-by': 'PHP/8.1',
+        }
+        mock_get.return_value = response
+
+        result = check_headers('http://127.0.0.1:5000')
+
+        present = {f.header_name for f in result.findings if f.present}
+        assert 'Strict-Transport-Security' in present
+        assert 'X-Frame-Options' in present
+        assert 'X-Powered-By: PHP/8.1' in result.technology_fingerprints
+
+    @pytest.mark.parametrize('value, optimal', [
+        ('max-age=31536000; includeSubDomains; preload', True),
+        ('max-age=31536000', True),
+        ('includeSubDomains; max-age=31536000', True),
+        ('max-age=31536000; preload; includeSubDomains', True),
+        ('max-age="31536000"', True),
+        ('max-age=31536000; max-age=0', False),
+        ('max-age=abc', False),
+        ('includeSubDomains', False),
+        ('max-age=' + '9' * 100000, False),
+        ('max-age=31536000' + ' ' * 5000, False),
+    ])
+    @patch('scanner.header_check.requests.get')
+    def test_hsts_value_validation(self, mock_get, value, optimal):
+        """Test that HSTS directives are validated in any order."""
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {'Strict-Transport-Security': value}
+        mock_get.return_value = response
+
+        result = check_headers('http://127.0.0.1:5000')
+
+        hsts = next(f for f in result.findings
+                    if f.header_name == 'Strict-Transport-Security')
+        assert ('may not be optimal' not in hsts.description) == optimal
+
+    @patch('scanner.header_check.requests.get')
+    @patch('scanner.header_check.http.client.HTTPConnection')
+    def test_check_headers_stdlib_path(self, mock_conn_cls, mock_get):
+        """Test the http.client fetch path used when use_requests=False."""
+        conn = mock_conn_cls.return_value
+        conn.getresponse.return_value.status = 200
+        conn.getresponse.return_value.getheaders.return_value = [
+            ('X-Frame-Options', 'DENY'),
+            ('Server', 'nginx/1.18.0'),
+        ]
+
+        result = check_headers('http://127.0.0.1:5000/app?x=1', use_requests=False)
+
+        mock_get.assert_not_called()
+        conn.request.assert_called_once()
+        assert conn.request.call_args.args[:2] == ('GET', '/app?x=1')
+        conn.close.assert_called_once()
+        assert result.status_code == 200
+        assert result.present_headers == 1
+        assert result.server_header == 'nginx/1.18.0'
+
+    @patch('scanner.header_check.requests.get')
+    def test_disclosure_headers_in_canonical_order(self, mock_get):
+        """Test that disclosure headers are reported in a fixed order whatever the response order."""
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {
+            'x-generator': 'Drupal 9',
+            'SERVER': 'Apache/2.4.41',
+            'X-Powered-By': 'PHP/7.4',
+        }
+        mock_get.return_value = response
+
+        result = check_headers('http://127.0.0.1:5000')
+
+        assert result.technology_fingerprints == [
+            'Server: Apache/2.4.41',
+            'X-Powered-By: PHP/7.4',
+            'X-Generator: Drupal 9',
+        ]
+        assert result.server_header == 'Apache/2.4.41'
+
+    @patch('scanner.header_check.requests.get')
+    def test_check_headers_skips_body(self, mock_get, mock_response_with_security_headers):
+        """Test that the header check streams and releases the response."""
+        mock_get.return_value = mock_response_with_security_headers
+        check_headers('http://127.0.0.1:5000')
+
+        assert mock_get.call_args.kwargs['stream'] is True
+        mock_response_with_security_headers.close.assert_called_once()
+
+    def test_check_headers_reuses_pooled_connection(self):
+        """Test repeated same-host checks share one keep-alive connection."""
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                body = b'<html>ok</html>'
+                self.send_response(200)
+                self.send_header('X-Frame-Options', 'DENY')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class CountingServer(ThreadingHTTPServer):
+            connections = 0
+
+            def get_request(self):
+                CountingServer.connections += 1
+                return super().get_request()
+
+        server = CountingServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        session = requests.Session()
+        try:
+            url = f'http://127.0.0.1:{server.server_port}/'
+            results = [check_headers(url, session=session) for _ in range(5)]
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+        assert all(r.status_code == 200 for r in results)
+        assert CountingServer.connections == 1
+
+    @pytest.mark.parametrize('url', [
+        '127.0.0.1:5000',
+        'http://127.0.0.1:abc/',
+    ])
+    @patch('scanner.header_check.http.client.HTTPConnection')
+    def test_check_headers_stdlib_invalid_url(self, mock_conn_cls, url, capsys):
+        """Test malformed URLs are reported, not raised, on the http.client path."""
+        result = check_headers(url, use_requests=False)
+
+        mock_conn_cls.assert_not_called()
+        assert result.status_code == 0
+        assert result.findings == []
+        assert '[!] Request error' in capsys.readouterr().out
+
+    def test_check_headers_batch(self, mock_response_with_security_headers):
+        """Test that batch checks return one result per URL, in order."""
+        urls = ['http://127.0.0.1:5000', 'http://127.0.0.1:5001']
+        with patch.object(
+            header_check._SESSION, 'get',
+            return_value=mock_response_with_security_headers,
+        ) as mock_get:
+            results = check_headers_batch(urls)
+
+        assert [r.target_url for r in results] == urls
+        assert all(r.score == 100 for r in results)
+        assert mock_get.call_count == 2
+
+    def test_batch_session_shares_tls_context(self):
+        """Test that the batch session's pools reuse one unverified TLS context."""
+        adapter = header_check._SESSION.get_adapter('https://example.com')
+        ssl_context = adapter.poolmanager.connection_pool_kw['ssl_context']
+
+        assert ssl_context is header_check._UNVERIFIED_SSL
+        assert ssl_context.verify_mode == ssl.CERT_NONE
+        assert ssl_context.check_hostname is False
+
+    @patch('scanner.header_check.http.client.HTTPConnection')
+    def test_check_headers_batch_stdlib(self, mock_conn_cls):
+        """Test that batch sweeps can use the http.client fetch path."""
+        conn = mock_conn_cls.return_value
+        conn.getresponse.return_value.status = 200
+        conn.getresponse.return_value.getheaders.return_value = []
+        urls = [f'http://10.0.0.{i}' for i in range(1, 6)]
+
+        with patch.object(header_check._SESSION, 'get') as mock_get:
+            results = check_headers_batch(urls, use_requests=False)
+
+        mock_get.assert_not_called()
+        assert [r.target_url for r in results] == urls
+        assert all(r.status_code == 200 for r in results)
+
+    def test_check_headers_batch_processes(self, mock_response_with_security_headers):
+        """Test that process-pool classification matches the threaded path."""
+        urls = [f'http://10.0.0.{i}' for i in range(1, 5)]
+
+        def fake_get(url, **kwargs):
+            if url.endswith('.3'):
+                raise requests.exceptions.ConnectionError()
+            return mock_response_with_security_headers
+
+        with patch.object(header_check._SESSION, 'get', side_effect=fake_get) as mock_get:
+            threaded = check_headers_batch(urls)
+            pooled = check_headers_batch(urls, processes=True)
+
+        # Fetches stay in this process, on the thread pool
+        assert mock_get.call_count == 8
+        assert pooled == threaded
+        assert [r.status_code for r in pooled] == [200, 200, 0, 200]
+        assert pooled[0].score == 100
+
+    @patch('scanner.header_check.requests.get')
+    def test_check_headers_cached(self, mock_get, mock_response_with_security_headers):
+        """Test that repeat checks within the TTL reuse the cached result."""
+        mock_get.return_value = mock_response_with_security_headers
+        header_check._CACHE.clear()
+        url = 'http://127.0.0.1:5000/cached'
+
+        first = check_headers_cached(url, ttl=60)
+        second = check_headers_cached(url, ttl=60)
+        assert second is first
+        assert mock_get.call_count == 1
+
+        header_check._CACHE.clear()
+        check_headers_cached(url, ttl=0)
+        check_headers_cached(url, ttl=0)
+        assert mock_get.call_count == 3
+        header_check._CACHE.clear()
+
     def test_get_missing_headers(self):
         """Test filtering of missing headers."""
         result = HeaderCheckResult(
@@ -294,6 +537,43 @@ class TestHeaderCheck:
         high_findings = get_findings_by_severity(result, 'High')
         assert len(high_findings) == 2
 
+    @patch('scanner.header_check.requests.get')
+    def test_missing_findings_are_shared(self, mock_get, mock_response_no_security_headers):
+        """Test that missing-header findings reuse frozen per-header instances."""
+        mock_get.return_value = mock_response_no_security_headers
+        first = get_missing_headers(check_headers('http://127.0.0.1:5000'))
+        second = get_missing_headers(check_headers('http://127.0.0.1:5000'))
+
+        assert len(first) == len(SECURITY_HEADERS)
+        assert all(a is b for a, b in zip(first, second))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first[0].severity = 'Low'
+
+    @patch('scanner.header_check.requests.get')
+    def test_present_findings_are_shared(self, mock_get, mock_response_with_security_headers):
+        """Test that identical header values across targets share one finding."""
+        mock_get.return_value = mock_response_with_security_headers
+        first = check_headers('http://127.0.0.1:5000').findings
+        second = check_headers('http://127.0.0.1:5001').findings
+
+        assert len(first) == len(second)
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_group_by_severity(self):
+        """Test that findings are grouped per severity in report order."""
+        result = HeaderCheckResult(target_url='http://test', status_code=200)
+        result.findings = [
+            HeaderFinding('A', False, None, 'Medium', '', '', '', ''),
+            HeaderFinding('B', False, None, 'High', '', '', '', ''),
+            HeaderFinding('C', False, None, 'Medium', '', '', '', ''),
+        ]
+
+        groups = group_by_severity(result)
+
+        assert list(groups) == ['Critical', 'High', 'Medium', 'Low', 'Informational']
+        assert [f.header_name for f in groups['Medium']] == ['A', 'C']
+        assert groups['Critical'] == []
+
     @patch('scanner.header_check.requests.get')
     def test_format_header_report(self, mock_get, mock_response_no_security_headers):
         """Test report formatting."""
@@ -305,6 +585,19 @@ class TestHeaderCheck:
         assert 'HTTP SECURITY HEADER ANALYSIS REPORT' in report_text
         assert 'http://127.0.0.1:5000' in report_text
 
+    @patch('scanner.header_check.requests.get')
+    def test_to_json(self, mock_get, mock_response_no_security_headers):
+        """Test JSON export with and without orjson."""
+        mock_get.return_value = mock_response_no_security_headers
+        result = check_headers('http://127.0.0.1:5000')
+
+        data = json.loads(to_json(result))
+        assert data['target_url'] == 'http://127.0.0.1:5000'
+        assert len(data['findings']) == len(result.findings)
+
+        with patch.object(header_check, 'ORJSON_AVAILABLE', False):
+            assert json.loads(to_json(result)) == data
+
     def test_security_headers_config_completeness(self):
         """Test that all security headers have required config fields."""
         required_fields = ['severity', 'description', 'recommendation',
@@ -502,6 +795,10 @@ class TestXSSScanner:
 # Port Scanner Tests
 # -----------------------------------------------------------------------
 
+# Event loop class whose sock_* methods the port scanner's probes use
+SELECTOR_LOOP = 'asyncio.selector_events.BaseSelectorEventLoop'
+
+
 class TestPortScanner:
     """Tests for the port_scanner module."""
 
@@ -545,6 +842,28 @@ class TestPortScanner:
         assert finding.state == 'open'
         assert finding.port == 22
 
+    @pytest.mark.parametrize('port, probe', [
+        (22, None),
+        (25, None),
+        (80, b'HEAD / HTTP/1.0\r\n\r\n'),
+        (6379, b'\r\n'),
+    ])
+    @patch('scanner.port_scanner.socket.socket')
+    def test_scan_port_banner_probe(self, mock_socket_class, port, probe):
+        """Test that server-first services are read without sending a probe."""
+        mock_sock = MagicMock()
+        mock_sock.connect_ex.return_value = 0
+        mock_sock.recv.return_value = b'banner'
+        mock_socket_class.return_value = mock_sock
+
+        finding = _scan_port('127.0.0.1', port, timeout=2.0)
+
+        assert finding.banner == 'banner'
+        if probe is None:
+            mock_sock.send.assert_not_called()
+        else:
+            mock_sock.send.assert_called_once_with(probe)
+
     @patch('scanner.port_scanner.socket.socket')
     def test_scan_port_closed(self, mock_socket_class):
         """Test scanning a closed port."""
@@ -557,16 +876,226 @@ class TestPortScanner:
         assert finding.state == 'closed'
 
     @patch('scanner.port_scanner.socket.socket')
-    def test_scan_port_timeout(self, mock_socket_class):
-        """Test scanning a filtered/timed-out port."""
+    def test_scan_port_closed_finding_reused(self, mock_socket_class):
+        """Test that repeat probes of a closed port share one finding."""
         mock_sock = MagicMock()
-        mock_sock.connect_ex.side_effect = socket.timeout()
+        mock_sock.connect_ex.return_value = 111
+        mock_socket_class.return_value = mock_sock
+
+        first = _scan_port('127.0.0.1', 12346, timeout=2.0)
+        second = _scan_port('10.0.0.1', 12346, timeout=2.0)
+
+        assert first is second
+        assert first.port == 12346
+        assert first.description == 'Port 12346 is closed.'
+
+    @pytest.mark.parametrize('code', [errno.EAGAIN, errno.EWOULDBLOCK, errno.ETIMEDOUT])
+    @patch('scanner.port_scanner.socket.socket')
+    def test_scan_port_timeout(self, mock_socket_class, code):
+        """Test a timed-out connect_ex is filtered, as on the event loop."""
+        mock_sock = MagicMock()
+        # A real socket with a timeout returns an errno instead of raising
+        mock_sock.connect_ex.return_value = code
         mock_socket_class.return_value = mock_sock
 
         finding = _scan_port('127.0.0.1', 445, timeout=1.0)
 
         assert finding.state == 'filtered'
 
+    @patch('scanner.port_scanner.socket.socket')
+    def test_scan_port_open_unknown_service(self, mock_socket_class):
+        """Test that ports outside COMMON_PORTS get the generic service info."""
+        mock_sock = MagicMock()
+        mock_sock.connect_ex.return_value = 0
+        mock_sock.recv.return_value = b''
+        mock_socket_class.return_value = mock_sock
+
+        finding = _scan_port('127.0.0.1', 31337, timeout=2.0)
+
+        assert finding.service == 'unknown-31337'
+        assert finding.severity == 'Low'
+        assert finding.description == 'Service detected on port 31337.'
+
+    @patch('scanner.port_scanner.socket.socket')
+    def test_scan_port_sets_timeout_once(self, mock_socket_class):
+        """Test that the banner grab reuses the connect timeout when equal."""
+        mock_sock = MagicMock()
+        mock_sock.connect_ex.return_value = 0
+        mock_sock.recv.return_value = b'220 ready'
+        mock_socket_class.return_value = mock_sock
+
+        _scan_port('127.0.0.1', 21, timeout=2.0)
+        assert mock_sock.settimeout.call_count == 1
+
+        mock_sock.reset_mock()
+        _scan_port('127.0.0.1', 21, timeout=0.5)
+        assert [c.args[0] for c in mock_sock.settimeout.call_args_list] == [0.5, 2.0]
+
+    @patch('scanner.port_scanner.socket.socket')
+    def test_scan_port_closes_socket_on_timeout(self, mock_socket_class):
+        """Test that the socket is released when the connect times out."""
+        mock_sock = MagicMock()
+        mock_sock.connect_ex.side_effect = socket.timeout()
+        mock_socket_class.return_value = mock_sock
+
+        _scan_port('127.0.0.1', 445, timeout=1.0)
+
+        mock_sock.close.assert_called_once()
+
+    def test_scan_ports_async_driver(self):
+        """Test that the event-loop driver classifies open and closed ports."""
+        async def fake_connect(loop, sock, address):
+            if address[1] != 22:
+                raise ConnectionRefusedError()
+
+        async def fake_recv(loop, sock, nbytes):
+            return b'SSH-2.0-OpenSSH_8.9'
+
+        sendall = AsyncMock()
+        with patch(f'{SELECTOR_LOOP}.sock_connect', fake_connect), \
+                patch(f'{SELECTOR_LOOP}.sock_recv', fake_recv), \
+                patch(f'{SELECTOR_LOOP}.sock_sendall', sendall):
+            result = scan_ports('127.0.0.1', ports=[22, 80, 443])
+
+        assert result.open_ports == [22]
+        assert result.closed_ports == 2
+        assert result.findings[0].banner == 'SSH-2.0-OpenSSH_8.9'
+        sendall.assert_not_called()  # SSH greets first; no probe needed
+
+    def test_scan_ports_async_timeout_is_filtered(self):
+        """Test that a connect timeout on the event loop is reported as filtered."""
+        async def never_connects(loop, sock, address):
+            await asyncio.sleep(10)
+
+        with patch(f'{SELECTOR_LOOP}.sock_connect', never_connects):
+            result = scan_ports('127.0.0.1', ports=[445], timeout=0.05)
+
+        assert result.filtered_ports == 1
+        assert result.findings[0].state == 'filtered'
+
+    def test_scan_ports_async_live_banner(self):
+        """Test a real open port with a banner and a real closed port."""
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        open_port = listener.getsockname()[1]
+
+        def serve():
+            conn, _ = listener.accept()
+            conn.recv(16)
+            conn.sendall(b'HELLO 1.0\r\n')
+            conn.close()
+
+        server = threading.Thread(target=serve, daemon=True)
+        server.start()
+
+        unused = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        unused.bind(('127.0.0.1', 0))
+        closed_port = unused.getsockname()[1]
+        unused.close()
+
+        try:
+            result = scan_ports('127.0.0.1', ports=[open_port, closed_port], timeout=1.0)
+        finally:
+            server.join(timeout=2)
+            listener.close()
+
+        assert result.open_ports == [open_port]
+        assert result.closed_ports == 1
+        assert result.findings[0].banner == 'HELLO 1.0'
+
+    def test_scan_ports_resolves_host_once(self):
+        """Test that probes connect to the resolved IP without further lookups."""
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+        try:
+            with patch('socket.getaddrinfo', side_effect=AssertionError('lookup')), \
+                    patch('scanner.port_scanner.BANNER_TIMEOUT', 0.05):
+                result = scan_ports('127.0.0.1', ports=[port], timeout=0.5)
+        finally:
+            listener.close()
+
+        assert result.open_ports == [port]
+        assert result.errors == []
+
+    def test_adaptive_limit_ramps_and_backs_off(self):
+        """Test that the adaptive limit grows on success and halves on timeouts."""
+        async def exercise():
+            limiter = _AdaptiveLimit(ceiling=50)
+            assert limiter.limit == 8
+            for _ in range(30):
+                limiter.record(False)
+            grown = limiter.limit
+            for _ in range(_AdaptiveLimit.WINDOW):
+                limiter.record(True)
+            return grown, limiter.limit
+
+        grown, backed_off = asyncio.run(exercise())
+
+        assert grown == 38
+        assert backed_off == 19
+
+    def test_scan_ports_adaptive_caps_in_flight(self):
+        """Test that an adaptive scan starts with only a few probes in flight."""
+        in_flight = peak = 0
+
+        async def slow_refuse(loop, sock, address):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            raise ConnectionRefusedError()
+
+        with patch(f'{SELECTOR_LOOP}.sock_connect', slow_refuse):
+            result = scan_ports('127.0.0.1', ports=list(range(1, 11)),
+                                max_threads=50, adaptive=True)
+
+        assert result.closed_ports == 10
+        assert peak == 8
+
+    @patch('scanner.port_scanner.ThreadPoolExecutor')
+    @patch('scanner.port_scanner._scan_port')
+    def test_scan_ports_thread_fallback_in_event_loop(self, mock_scan_port, mock_executor_class):
+        """Test the right-sized thread pool used when a loop is already running."""
+        mock_executor_class.side_effect = ThreadPoolExecutor
+        mock_scan_port.side_effect = lambda host, port, timeout: PortFinding(
+            port, 'closed', 'x', None, 'Informational', '', '')
+
+        async def scan_inside_loop():
+            return scan_ports('127.0.0.1', ports=[22, 80, 443], max_threads=50)
+
+        result = asyncio.run(scan_inside_loop())
+
+        assert mock_executor_class.call_args.kwargs['max_workers'] == 3
+        assert result.closed_ports == 3
+
+    def test_decode_banner(self):
+        """Test banner decoding, invalid byte replacement and truncation."""
+        assert _decode_banner(b'  SSH-2.0-OpenSSH_8.9\r\n') == 'SSH-2.0-OpenSSH_8.9'
+        assert _decode_banner(b'caf\xe9') == 'caf\ufffd'
+        assert _decode_banner(b'') == ''
+
+        long_banner = _decode_banner(b'A' * 1024)
+        assert long_banner == 'A' * 200 + '...'
+
+    def test_full_scan_probes_ports_in_order(self):
+        """Test that full scans probe every port once, in ascending order."""
+        assert FULL_SCAN_PORTS == sorted(set(FULL_SCAN_PORTS))
+
+        probed = []
+
+        async def record_order(host, ports, *args, **kwargs):
+            probed.extend(ports)
+            return []
+
+        with patch('scanner.port_scanner._scan_ports_async', record_order):
+            scan_ports('127.0.0.1', scan_type='full')
+
+        assert probed == FULL_SCAN_PORTS
+
     def test_port_finding_dataclass(self):
         """Test PortFinding creation."""
         finding = PortFinding(
@@ -581,6 +1110,12 @@ class TestPortScanner:
         assert finding.port == 80
         assert finding.service == 'HTTP'
 
+    def test_port_finding_is_immutable(self):
+        """Test that shared PortFinding instances cannot be modified."""
+        finding = PortFinding(80, 'open', 'HTTP', None, 'Medium', '', '')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            finding.state = 'closed'
+
 
 # -----------------------------------------------------------------------
 # Directory Scanner Tests
@@ -657,6 +1192,229 @@ class TestDirectoryScanner:
 
         assert result.paths_checked == 2
 
+    @patch('scanner.directory_scanner.requests.get')
+    def test_scan_dedupes_trailing_slash_paths(self, mock_get):
+        """Test that '/admin' and '/admin/' are only probed once."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        result = scan_directories(
+            'http://127.0.0.1:5000',
+            categories=['admin_panels'],
+            custom_paths=['/admin/'],
+        )
+
+        probed = [call.args[0] for call in mock_get.call_args_list]
+        assert len(probed) == len(set(probed))
+        assert result.paths_checked == len(SCAN_PATHS['admin_panels']['paths']) - 3
+
+    @patch('scanner.directory_scanner.requests.get')
+    def test_scan_keeps_case_distinct_paths(self, mock_get):
+        """Test that paths differing only in case are both probed."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        result = scan_directories(
+            'http://127.0.0.1:5000',
+            categories=[],
+            custom_paths=['/Backup', '/backup', '/backup/'],
+        )
+
+        probed = sorted(call.args[0] for call in mock_get.call_args_list)
+        assert probed == [
+            'http://127.0.0.1:5000/Backup',
+            'http://127.0.0.1:5000/backup',
+        ]
+        assert result.paths_checked == 2
+
+    @patch('scanner.directory_scanner.requests.get')
+    def test_scan_sorts_findings_by_severity(self, mock_get):
+        """Test that findings are ordered most severe first."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'Found'
+        mock_get.return_value = mock_response
+
+        result = scan_directories(
+            'http://127.0.0.1:5000',
+            categories=['server_info', 'config_files'],
+        )
+
+        severities = [f.severity for f in result.findings]
+        assert severities[0] == 'Critical'
+        assert severities[-1] == 'Low'
+
+    @patch('scanner.directory_scanner.requests.get')
+    def test_scan_duplicate_path_keeps_most_severe_category(self, mock_get):
+        """Test that a path listed twice is reported under the worse category."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'Found'
+        mock_get.return_value = mock_response
+
+        result = scan_directories(
+            'http://127.0.0.1:5000',
+            categories=['server_info'],
+            custom_paths=['/robots.txt'],
+        )
+
+        robots = [f for f in result.findings if f.path == '/robots.txt']
+        assert len(robots) == 1
+        assert robots[0].severity == 'Medium'
+        assert robots[0].category == 'Custom Path'
+
+    @patch('scanner.directory_scanner.requests.get')
+    def test_scan_builds_absolute_urls(self, mock_get):
+        """Test that probe URLs join the target and path with one slash."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        scan_directories(
+            'http://127.0.0.1:5000/app/',
+            categories=[],
+            custom_paths=['/admin', 'login'],
+        )
+
+        probed = sorted(call.args[0] for call in mock_get.call_args_list)
+        assert probed == [
+            'http://127.0.0.1:5000/app/admin',
+            'http://127.0.0.1:5000/app/login',
+        ]
+
+    @patch('scanner.directory_scanner.requests.get')
+    def test_scan_protected_paths_lower_severity(self, mock_get):
+        """Test that 401/403 responses are reported at reduced severity."""
+        mock_response = MagicMock()
+        mock_response.status_code = 403
+        mock_response.content = b'Forbidden'
+        mock_get.return_value = mock_response
+
+        result = scan_directories(
+            'http://127.0.0.1:5000',
+            categories=['config_files'],
+        )
+
+        finding = result.findings[0]
+        assert finding.severity == 'Medium'
+        assert finding.description.startswith(
+            'Path exists but is protected (HTTP 403).'
+        )
+
+    @patch('scanner.directory_scanner.requests.get')
+    def test_scan_ignores_wildcard_responses(self, mock_get):
+        """Test that a catch-all 200 page does not become a finding."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b'<html>app shell</html>'
+        mock_get.return_value = mock_response
+
+        result = scan_directories(
+            'http://127.0.0.1:5000',
+            categories=['admin_panels'],
+            detect_wildcard=True,
+        )
+
+        assert result.wildcard_status == 200
+        assert result.paths_found == 0
+
+    @patch('scanner.directory_scanner.requests.get')
+    def test_scan_aborts_when_target_unreachable(self, mock_get):
+        """Test that repeated connection failures stop the scan early."""
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+
+        result = scan_directories('http://127.0.0.1:5000')
+
+        assert result.paths_checked == MAX_CONSECUTIVE_ERRORS
+        assert result.paths_found == 0
+        assert any('aborted' in e for e in result.errors)
+
+    def test_format_directory_report_rows(self):
+        """Test that findings are rendered as aligned table rows."""
+        result = DirectoryScanResult(target_url='http://127.0.0.1:5000')
+        result.findings.append(DirectoryFinding(
+            url='http://127.0.0.1:5000/.env', path='/.env', status_code=200,
+            content_length=10, category='Configuration File',
+            severity='Critical', description='', recommendation='',
+            owasp_category='', cwe_id='',
+        ))
+
+        report = format_directory_report(result)
+
+        assert (
+            "  /.env                          200      "
+            "Configuration File     Critical"
+        ) in report.splitlines()
+
+    def test_body_length_skips_large_bodies(self):
+        """Test that large bodies are sized from Content-Length, not read."""
+        response = MagicMock()
+        response.headers = {'Content-Length': '10000000'}
+        type(response).content = PropertyMock(side_effect=AssertionError)
+        assert _body_length(response) == 10000000
+
+    def test_body_length_bounds_chunked_bodies(self):
+        """Test that bodies without Content-Length are read only up to the cap."""
+        response = MagicMock()
+        response.headers = {}
+        chunks = iter([b'x' * 8192] * 100)
+        response.iter_content.return_value = chunks
+        assert MAX_BODY_READ < _body_length(response) <= MAX_BODY_READ + 8192
+        assert next(chunks, None) is not None
+
+    def test_create_session_pool_size(self):
+        """Test that the shared session's pool is sized to the workers."""
+        session = create_session(pool_size=24)
+        adapter = session.get_adapter('http://127.0.0.1:5000')
+        assert adapter._pool_maxsize == 24
+        assert session.verify is False
+        session.close()
+
+    def test_create_session_disables_nagle(self):
+        """Test that pooled connections are opened with TCP_NODELAY."""
+        session = create_session()
+        adapter = session.get_adapter('http://127.0.0.1:5000')
+        pool = adapter.poolmanager.connection_from_url('http://127.0.0.1:5000')
+        conn = pool._new_conn()
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in conn.socket_options
+        session.close()
+
+
+    def test_create_session_refuses_cookies(self):
+        """Test a Set-Cookie from one payload is not sent with the next."""
+        seen_cookies = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                seen_cookies.append(self.headers.get('Cookie'))
+                self.send_response(200)
+                self.send_header('Set-Cookie', 'session=admin; Path=/')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        session = create_session()
+        try:
+            base = f'http://127.0.0.1:{server.server_port}'
+            session.get(f'{base}/login?user=admin%27--')
+            session.get(f'{base}/search?q=%3Cscript%3E')
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+        assert seen_cookies == [None, None]
+        assert len(session.cookies) == 0
 
 # -----------------------------------------------------------------------
 # Reporter Tests
@@ -699,6 +1457,20 @@ class TestReporter:
         assert summary['Low'] == 0
         assert summary['Informational'] == 0
 
+    def test_generate_summary_unknown_severity(self):
+        """Test unknown severities count toward Total only."""
+        vulns = [
+            VulnerabilityEntry(
+                title='Odd', severity='Unknown', category='Test',
+                description='', evidence='', remediation='', url='',
+            )
+        ]
+        summary = generate_summary(vulns)
+
+        assert summary['Total'] == 1
+        assert 'Unknown' not in summary
+        assert sum(summary.values()) == 1
+
     def test_build_report(self, sample_vulnerabilities):
         """Test complete report building."""
         start = datetime(2025, 1, 1, 10, 0, 0)
@@ -714,6 +1486,34 @@ class TestReporter:
         assert report.target_url == 'http://127.0.0.1:5000'
         assert report.scan_duration == 300.0
         assert len(report.modules_executed) == 3
+        assert report.scan_start == '2025-01-01 10:00:00'
+        assert report.scan_end == '2025-01-01 10:05:00'
+
+    def test_build_report_summary_matches_helpers(self):
+        """Test build_report's single tally agrees with the public helpers."""
+        header_result = HeaderCheckResult(
+            target_url='http://test.com',
+            status_code=200,
+        )
+        header_result.findings = [
+            HeaderFinding('X-Frame-Options', False, None, 'High',
+                          'Missing', 'Add it', 'A05:2021', 'CWE-1021'),
+            HeaderFinding('Server', True, 'nginx', 'Low',
+                          'Disclosed', 'Remove it', 'A05:2021', 'CWE-200'),
+        ]
+        now = datetime(2025, 1, 1, 10, 0, 0)
+
+        report = build_report(
+            target_url='http://test.com',
+            scan_start=now,
+            scan_end=now,
+            modules_executed=['headers'],
+            header_results=header_result,
+        )
+
+        assert report.summary == generate_summary(report.vulnerabilities)
+        assert report.risk_score == calculate_risk_score(report.vulnerabilities)
+        assert report.summary['Total'] == 2
 
     def test_normalize_findings_header_results(self):
         """Test normalization of header check results."""
@@ -732,6 +1532,30 @@ class TestReporter:
         assert vulns[0].module == 'header_check'
         assert 'X-Frame-Options' in vulns[0].title
 
+    def test_normalize_findings_severity_order(self):
+        """Test findings come back by severity, stable within a level."""
+        header_result = HeaderCheckResult(
+            target_url='http://test.com',
+            status_code=200,
+        )
+        header_result.findings = [
+            HeaderFinding('Referrer-Policy', False, None, 'Low',
+                          'Missing', 'Add it', 'A05:2021', 'CWE-200'),
+            HeaderFinding('X-Frame-Options', False, None, 'High',
+                          'Missing', 'Add it', 'A05:2021', 'CWE-1021'),
+            HeaderFinding('Permissions-Policy', False, None, 'Low',
+                          'Missing', 'Add it', 'A05:2021', 'CWE-693'),
+            HeaderFinding('Content-Security-Policy', False, None, 'High',
+                          'Missing', 'Add it', 'A05:2021', 'CWE-693'),
+        ]
+
+        vulns = normalize_findings(header_results=header_result)
+
+        assert [v.title.split(': ')[1] for v in vulns] == [
+            'X-Frame-Options', 'Content-Security-Policy',
+            'Referrer-Policy', 'Permissions-Policy',
+        ]
+
     def test_normalize_findings_sqli_results(self):
         """Test normalization of SQLi results."""
         sqli_result = SQLiScanResult(target_url='http://test.com')
@@ -755,6 +1579,21 @@ class TestReporter:
         assert vulns[0].module == 'sqli_scanner'
         assert vulns[0].severity == 'Critical'
 
+    def test_normalize_findings_port_results(self):
+        """Test only open, non-informational ports become vulnerabilities."""
+        port_result = PortScanResult(target_host='test.com', target_ip='10.0.0.1')
+        port_result.findings = [
+            PortFinding(21, 'open', 'FTP', None, 'High', 'FTP open', 'Close it'),
+            PortFinding(443, 'open', 'HTTPS', None, 'Informational', '', ''),
+            PortFinding(3306, 'filtered', 'MySQL', None, 'High', '', ''),
+        ]
+
+        vulns = normalize_findings(port_results=port_result)
+
+        assert len(vulns) == 1
+        assert vulns[0].url == 'test.com:21'
+        assert vulns[0].evidence.endswith('Banner: N/A')
+
     def test_render_json_report(self, sample_vulnerabilities):
         """Test JSON report generation."""
         report = ScanReport(
@@ -782,9 +1621,99 @@ class TestReporter:
             assert data['target_url'] == 'http://test.com'
             assert len(data['vulnerabilities']) == 5
             assert data['summary']['Total'] == 5
+            assert list(data['vulnerabilities'][0]) == [
+                'title', 'severity', 'category', 'description', 'evidence',
+                'remediation', 'url', 'parameter', 'owasp_category',
+                'cwe_id', 'module',
+            ]
         finally:
             os.unlink(output_path)
 
+    def test_render_html_report_reuses_template(self, sample_vulnerabilities):
+        """Test repeated HTML renders share one compiled template."""
+        report = ScanReport(
+            target_url='http://test.com',
+            scan_start='2025-01-01 10:00:00',
+            scan_end='2025-01-01 10:05:00',
+            scan_duration=300.0,
+            modules_executed=['headers'],
+            vulnerabilities=sample_vulnerabilities,
+            summary=generate_summary(sample_vulnerabilities),
+            risk_score=calculate_risk_score(sample_vulnerabilities),
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            first = render_html_report(report, os.path.join(tmp, 'a.html'))
+            cached = dict(reporter._TEMPLATE_CACHE)
+            second = render_html_report(report, os.path.join(tmp, 'b.html'))
+
+            assert reporter._TEMPLATE_CACHE == cached
+            with open(first, encoding='utf-8') as f:
+                html = f.read()
+            assert 'http://test.com' in html
+            assert os.path.getsize(second) > 0
+
+    def test_render_json_report_creates_directory(self, sample_vulnerabilities):
+        """Test a missing output directory is created and the path resolved."""
+        report = ScanReport(
+            target_url='http://test.com',
+            scan_start='2025-01-01 10:00:00',
+            scan_end='2025-01-01 10:05:00',
+            scan_duration=300.0,
+            vulnerabilities=sample_vulnerabilities,
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = os.path.join(tmp, 'nested', 'report.json')
+            result_path = render_json_report(report, output_path)
+
+            assert result_path == os.path.abspath(output_path)
+            assert os.path.isfile(result_path)
+
+    def test_bytecode_cache_unwritable_dir(self):
+        """Test the bytecode cache is skipped when its directory is unusable."""
+        with patch('scanner.reporter.os.access', return_value=False):
+            assert reporter._bytecode_cache() is None
+
+    def test_render_json_report_without_orjson(self, sample_vulnerabilities):
+        """Test the stdlib json fallback writes the same document."""
+        report = ScanReport(
+            target_url='http://test.com',
+            scan_start='2025-01-01 10:00:00',
+            scan_end='2025-01-01 10:05:00',
+            scan_duration=300.0,
+            vulnerabilities=sample_vulnerabilities,
+            summary=generate_summary(sample_vulnerabilities),
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            fast = render_json_report(report, os.path.join(tmp, 'fast.json'))
+            with patch.object(reporter, 'ORJSON_AVAILABLE', False):
+                slow = render_json_report(report, os.path.join(tmp, 'slow.json'))
+
+            with open(fast, encoding='utf-8') as f1, open(slow, encoding='utf-8') as f2:
+                assert json.load(f1) == json.load(f2)
+
+    def test_print_summary(self, sample_vulnerabilities, capsys):
+        """Test the console summary lists counts and the risk level."""
+        report = ScanReport(
+            target_url='http://test.com',
+            scan_start='2025-01-01 10:00:00',
+            scan_end='2025-01-01 10:05:00',
+            scan_duration=300.0,
+            modules_executed=['headers', 'sqli'],
+            summary=generate_summary(sample_vulnerabilities),
+            risk_score=8.5,
+        )
+
+        print_summary(report)
+        out = capsys.readouterr().out
+
+        assert 'Modules:    headers, sqli' in out
+        assert 'Critical:      2' in out
+        assert 'RISK LEVEL: CRITICAL' in out
+        assert out.endswith('=' * 70 + '\n')
+
     def test_severity_weights_completeness(self):
         """Test that all severity levels have weights."""
         expected = ['Critical', 'High', 'Medium', 'Low', 'Informational']